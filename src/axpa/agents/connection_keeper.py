@@ -0,0 +1,18 @@
+from mcp_agent.agents.agent import Agent
+
+
+def create_connection_keeper_agent(context=None) -> Agent:
+    """
+    Create an agent without servers that only holds the app's MCP connections open.
+
+    mcp_agent shuts down every persistent MCP server connection when the last
+    agent using them closes, so without a holder the servers are restarted by
+    each stage. Keep this agent entered for the whole workflow run to let the
+    stage agents reuse the running servers.
+    """
+    return Agent(
+        name="mcp_connection_keeper",
+        instruction="Hold MCP server connections open for the other agents.",
+        server_names=[],
+        context=context,
+    )
@@ -3,7 +3,8 @@ from mcp_agent.agents.agent import Agent
 def create_html_formatter_agent() -> Agent:
     instruction = rf"""
 You are an HTML formatter agent.
-Your task is to convert research paper summaries written in markdown format into well-structured HTML snippets suitable for direct embedding into a website or document. You will be given one of the following sections of a research paper summary one by one: research gap, related studies, methodology, experiments, further research, overall summary.
+Your task is to convert research paper summaries written in markdown format into well-structured HTML snippets suitable for direct embedding into a website or document. You will be given one or more of the following sections of a research paper summary: research gap, related studies, methodology, experiments, further research, overall summary.
+When several sections are given at once, each one is preceded by a marker line such as `### FIELD: research_gap`. Repeat every marker line unchanged, in the same order, and put the HTML snippet of that section right after it. Each section's snippet follows the rules below on its own.
 
 INPUT ASSUMPTIONS:
 - The input is a Markdown-formatted section of a research paper summary.
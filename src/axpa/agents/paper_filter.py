@@ -23,6 +23,9 @@ def create_paper_filter_agent() -> Agent:
            - reasoning: Brief 1-2 sentence explanation of your decision
            - relevance_score: Score from 0-10 indicating relevance to the query
 
+        When given several papers, judge each one independently and return one decision
+        per paper, with paper_id set to that paper's id.
+
         Be selective. Only accept papers that are clearly relevant and of high quality.
         Try to make your decision based on the paper information and the query.
         But you can use any tools to help you only when you feel the current context is not enough to make a decision.
@@ -1,7 +1,7 @@
 from mcp_agent.agents.agent import Agent
 
 
-def create_paper_scorer_agent(round_num: int = 1, has_markdown: bool = False) -> Agent:
+def create_paper_scorer_agent(round_num: int | None = None, has_markdown: bool = False) -> Agent:
     """
     Create a paper scoring agent based on ICLR review criteria.
 
@@ -9,9 +9,9 @@ def create_paper_scorer_agent(round_num: int = 1, has_markdown: bool = False) ->
     peer review best practices.
 
     Args:
-        round_num: The scoring round number (1 or 2)
-        has_markdown: If True, the paper content is provided directly in markdown format.
-                      Only arxiv-latex-mcp is available for viewing LaTeX formulas.
+        round_num: The scoring round number (1 or 2), or None for an agent serving both rounds
+        has_markdown: If True, the paper content is provided directly in markdown format
+                      and the ScoreResult is generated in one structured-output call, without tools.
                       If False, the agent needs to download and read the paper itself.
     """
     if has_markdown:
@@ -70,14 +70,13 @@ Your task is to evaluate a research paper and determine whether it brings suffic
 ## Important Notes
 
 - The paper content is provided directly in markdown format
-- If there are unclear mathematical formulas that you need to view in LaTeX format, use the `arxiv-latex-mcp` tool to get the paper's LaTeX source
 - Base evaluation on substantive content (not just title/abstract)
 - Be objective and evidence-based, don't hesitate to point out the flaws of the paper
 - Be constructive and specific in feedback
 - Consider value to the broader research community
 - Provide an independent assessment
         """
-        server_names = ["arxiv-latex-mcp"]
+        server_names = []
     else:
         # Full agent with all tools when paper needs to be downloaded
         instruction = f"""You are an expert academic paper reviewer and you will be given a paper id and a research query to review the paper.
@@ -154,7 +153,7 @@ Your task is to evaluate a research paper and determine whether it brings suffic
         server_names = ["arxiv-latex-mcp", "arxiv-mcp-server", "pdf-reader-mcp"]
 
     return Agent(
-        name=f"paper_scorer_round{round_num}",
+        name=f"paper_scorer_round{round_num}" if round_num is not None else "paper_scorer",
         instruction=instruction,
         server_names=server_names,
     )
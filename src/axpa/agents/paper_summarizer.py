@@ -54,7 +54,7 @@ For the **Related Studies** and **Further Research** sections, you may use `arxi
 ## Output Format
 
 Always answer in markdown format (including tables and code blocks). Mathematical expressions should be formatted using LaTeX notation (e.g. $...$ for inline equations and $$...$$ for display equations).
-Provide each summary section when prompted. Your responses will be collected sequentially to build the complete paper summary.
+Each request asks for a single summary section; answer only that section. Your responses will be combined to build the complete paper summary.
         """
         server_names = ["arxiv-paper-mcp", "arxiv-latex-mcp"]
     else:
@@ -300,6 +300,9 @@ def all_category_codes() -> list[str]:
     return [c.value.code for c in ArxivCategory]
 
 
+_VALID_CATEGORY_CODES = frozenset(all_category_codes())
+
+
 
 def all_category_prompts() -> str:
     return "\n".join([f"{c.value.code} - {c.value.name}: {c.value.description}" for c in ArxivCategory])
@@ -307,11 +310,10 @@ def all_category_prompts() -> str:
 
 
 def validate_category_codes(codes: Iterable[str]) -> tuple[list[str], list[str]]:
-    allowed = set(all_category_codes())
     ok: list[str] = []
     bad: list[str] = []
     for code in codes:
-        if code in allowed:
+        if code in _VALID_CATEGORY_CODES:
             ok.append(code)
         else:
             bad.append(code)
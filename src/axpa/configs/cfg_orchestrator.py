@@ -13,6 +13,9 @@ class OrchestratorConfig:
     search_limit: int = 2000
     # Score rounds
     score_rounds: int = 2
+    # Skip the second score round for papers whose first-round score is at or below / at or above these
+    score_early_exit_low: float | None = None
+    score_early_exit_high: float | None = None
     # Paper start time
     paper_start_time: datetime | None = None
     # Paper end time
@@ -36,6 +39,8 @@ class OrchestratorConfig:
             top_k=data.get("top_k", 10),
             search_limit=data.get("search_limit", 2000),
             score_rounds=data.get("score_rounds", 2),
+            score_early_exit_low=data.get("score_early_exit_low"),
+            score_early_exit_high=data.get("score_early_exit_high"),
             time_duration=data.get("time_duration", 7),
             output_format=data.get("output_format", "markdown"),
         )
@@ -20,6 +20,9 @@ class FilterResult(BaseModel):
     reasoning: str
     relevance_score: float = Field(ge=0, le=10)
 
+class BatchFilterResult(BaseModel):
+    results: List[FilterResult]
+
 class ScoreResult(BaseModel):
     """
     Paper evaluation scores based on ICLR review criteria.
@@ -43,6 +46,9 @@ class ScoreResult(BaseModel):
     weaknesses: str = Field(description="Key weak points or limitations")
     recommendation: str = Field(description="Accept/Reject recommendation with brief reasoning")
 
+class BatchScoreResult(BaseModel):
+    results: List[ScoreResult]
+
 class AggregatedScoreResult(BaseModel):
     paper_id: Optional[str] = None
     paper: Paper
@@ -1,14 +1,19 @@
 import asyncio
+import gzip
 import os
+import tempfile
+import zlib
+from collections import OrderedDict
 from pathlib import Path
+from urllib.parse import urlencode
 from mcp.server.fastmcp import FastMCP, Context
 from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from dotenv import load_dotenv
-import feedparser
+from lxml import etree
 import aiohttp
-import json
+import orjson
 import pymupdf.layout
 import pymupdf
 import pymupdf4llm
@@ -21,6 +26,15 @@ DEFAULT_RESULT_LIMIT = 5
 # Default cache directory for JSON page chunks
 DEFAULT_JSON_CACHE_DIR = "./outputs/papers/json_cache"
 
+# Atom namespace used by the arXiv API feed
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+# Timeout for downloading a paper's PDF, shared by every download
+PDF_DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=120)
+
+# Number of papers whose parsed page chunks are kept in memory (0 disables it)
+MEM_CACHE_MAX_PAPERS = int(os.getenv("AXPA_MEM_CACHE_PAPERS", "32"))
+
 
 @dataclass
 class ArxivPaperContext:
@@ -28,6 +42,17 @@ class ArxivPaperContext:
     session: aiohttp.ClientSession
 
 
+def _warmup_mupdf() -> None:
+    """Run markdown extraction once on a tiny in-memory PDF to initialize MuPDF."""
+    doc = pymupdf.open()
+    try:
+        page = doc.new_page()
+        page.insert_text((72, 72), "warmup")
+        pymupdf4llm.to_markdown(doc, show_progress=False)
+    finally:
+        doc.close()
+
+
 @asynccontextmanager
 async def arxiv_paper_lifespan(server: FastMCP) -> AsyncIterator[ArxivPaperContext]:
     """
@@ -39,8 +64,11 @@ async def arxiv_paper_lifespan(server: FastMCP) -> AsyncIterator[ArxivPaperConte
     Yields:
         ArxivPaperContext: The context containing the aiohttp session
     """
-    session = aiohttp.ClientSession()
+    # Pay MuPDF's lazy font/CMap initialization at startup, not on the first paper.
+    # Done before the session is created, so a failing warmup leaves nothing to close.
+    await asyncio.to_thread(_warmup_mupdf)
 
+    session = aiohttp.ClientSession()
     try:
         yield ArxivPaperContext(session=session)
     finally:
@@ -54,6 +82,36 @@ mcp = FastMCP(
 )
 
 
+def _parse_arxiv_entry(entry: etree._Element) -> dict:
+    """Build paper metadata from an Atom <entry> element of the arXiv API feed."""
+    # Extract paper ID from the URL
+    paper_id = entry.findtext(f"{ATOM_NS}id", "").split('/abs/')[-1]
+
+    # Format authors
+    authors = [(author.findtext(f"{ATOM_NS}name") or "").strip() for author in entry.iterfind(f"{ATOM_NS}author")]
+
+    # Extract categories
+    categories = [category.get("term") for category in entry.iterfind(f"{ATOM_NS}category")]
+
+    # The abstract page is the "alternate" link
+    link = next(
+        (link.get("href") for link in entry.iterfind(f"{ATOM_NS}link") if link.get("rel") == "alternate"),
+        "",
+    )
+
+    return {
+        "id": paper_id,
+        "title": (entry.findtext(f"{ATOM_NS}title") or "").strip(),
+        "authors": authors,
+        "summary": (entry.findtext(f"{ATOM_NS}summary") or "").strip(),
+        "published": entry.findtext(f"{ATOM_NS}published", ""),
+        "updated": entry.findtext(f"{ATOM_NS}updated", ""),
+        "link": link,
+        "pdf_link": f"https://arxiv.org/pdf/{paper_id}",
+        "categories": categories
+    }
+
+
 async def fetch_arxiv_papers(session: aiohttp.ClientSession, query: str, limit: int = DEFAULT_RESULT_LIMIT) -> list:
     """
     Fetch papers from arXiv based on the query.
@@ -66,74 +124,223 @@ async def fetch_arxiv_papers(session: aiohttp.ClientSession, query: str, limit:
     Returns:
         List of paper metadata
     """
-    formatted_query = query.replace(' ', '+')
-    url = f"http://export.arxiv.org/api/query?search_query=all:{formatted_query}&start=0&max_results={limit}"
+    # urlencode escapes '+', '&' and non-ASCII characters that would otherwise corrupt the query
+    params = urlencode({"search_query": f"all:{query}", "start": 0, "max_results": limit})
+    url = f"https://export.arxiv.org/api/query?{params}"
+
+    # Parse entries as the body streams in so parsing overlaps with the download
+    parser = etree.XMLPullParser(events=("end",), tag=f"{ATOM_NS}entry", resolve_entities=False)
+    papers = []
 
     async with session.get(url) as response:
         if response.status != 200:
             raise Exception(f"Failed to fetch papers: HTTP {response.status}")
 
-        content = await response.text()
-        feed = feedparser.parse(content)
-
-        papers = []
-        for entry in feed.entries:
-            # Extract paper ID from the URL
-            paper_id = entry.id.split('/abs/')[-1]
+        async for chunk in response.content.iter_any():
+            parser.feed(chunk)
+            for _, entry in parser.read_events():
+                papers.append(_parse_arxiv_entry(entry))
+                # Free each entry once parsed so memory does not grow with the result count
+                entry.clear()
 
-            # Format authors
-            authors = [author.name for author in entry.authors]
+    parser.close()
+    for _, entry in parser.read_events():
+        papers.append(_parse_arxiv_entry(entry))
 
-            # Extract categories
-            categories = [tag.term for tag in entry.tags] if hasattr(entry, 'tags') else []
-
-            # Create paper metadata
-            paper = {
-                "id": paper_id,
-                "title": entry.title,
-                "authors": authors,
-                "summary": entry.summary,
-                "published": entry.published,
-                "updated": entry.updated,
-                "link": entry.link,
-                "pdf_link": f"http://arxiv.org/pdf/{paper_id}",
-                "categories": categories
-            }
-
-            papers.append(paper)
-
-        return papers
+    return papers
 
 
 def _get_cache_path(paper_id: str, cache_dir: str) -> Path:
-    """Get the cache file path for a paper."""
+    """Get the cache directory for a paper (one JSON file per page)."""
     safe_id = paper_id.replace("/", "_")
     cache_path = Path(cache_dir)
     cache_path.mkdir(parents=True, exist_ok=True)
-    return cache_path / f"{safe_id}.json"
+    return cache_path / safe_id
+
+
+def _get_page_file(cache_path: Path, page_num: int) -> Path:
+    """Get the gzip-compressed cache file path for a single 0-based page."""
+    return cache_path / f"page_{page_num:04d}.json.gz"
+
 
+def _get_pdf_file(cache_path: Path) -> Path:
+    """Get the path of a PDF kept by get_paper_page_count until get_paper_content extracts it."""
+    return cache_path / "paper.pdf"
 
-def _load_from_cache(cache_file: Path) -> list[dict] | None:
-    """Load page chunks from cache file if it exists and is valid."""
-    if not cache_file.exists():
+
+def _read_page_file(cache_path: Path, page_num: int) -> bytes:
+    """Read the JSON bytes of a cached page, falling back to uncompressed files from older caches."""
+    page_file = _get_page_file(cache_path, page_num)
+    try:
+        return gzip.decompress(page_file.read_bytes())
+    except FileNotFoundError:
+        return (cache_path / f"page_{page_num:04d}.json").read_bytes()
+
+
+@dataclass
+class _CachedPaper:
+    """Parsed cache state of one paper, held in the in-memory LRU."""
+    page_count: int
+    pages: dict[int, dict] = field(default_factory=dict)
+
+
+# LRU of recently used papers keyed by cache directory, most recent last
+_MEM_CACHE: OrderedDict[Path, _CachedPaper] = OrderedDict()
+
+
+def _mem_cache_get(cache_path: Path) -> _CachedPaper | None:
+    """Return the in-memory entry for a paper and mark it as most recently used."""
+    entry = _MEM_CACHE.get(cache_path)
+    if entry is not None:
+        _MEM_CACHE.move_to_end(cache_path)
+    return entry
+
+
+def _mem_cache_put(cache_path: Path, entry: _CachedPaper) -> _CachedPaper:
+    """Store an in-memory entry for a paper, evicting the least recently used ones."""
+    if MEM_CACHE_MAX_PAPERS <= 0:
+        return entry
+
+    _MEM_CACHE[cache_path] = entry
+    _MEM_CACHE.move_to_end(cache_path)
+    while len(_MEM_CACHE) > MEM_CACHE_MAX_PAPERS:
+        _MEM_CACHE.popitem(last=False)
+    return entry
+
+
+def _load_page_count(cache_path: Path) -> int | None:
+    """Load the page count from the cache metadata without touching any page."""
+    entry = _mem_cache_get(cache_path)
+    if entry is not None:
+        return entry.page_count
+
+    meta_file = cache_path / "meta.json"
+    if not meta_file.exists():
         return None
 
     try:
-        with open(cache_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            # Verify it's a list of page chunks
-            if isinstance(data, list) and len(data) > 0:
-                return data
-    except (json.JSONDecodeError, IOError):
+        page_count = orjson.loads(meta_file.read_bytes()).get("page_count")
+        if isinstance(page_count, int) and page_count > 0:
+            return page_count
+    except (orjson.JSONDecodeError, IOError, AttributeError):
         pass
 
     return None
 
 
-def _save_to_cache(cache_file: Path, page_chunks: list[dict]) -> None:
-    """Save page chunks to cache file."""
-    with open(cache_file, "w", encoding="utf-8") as f:
-        json.dump(page_chunks, f, ensure_ascii=False, indent=2)
+def _load_from_cache(cache_path: Path, pages: list[int] | None = None) -> list[dict] | None:
+    """
+    Load page chunks from cache, reading only the requested pages.
+
+    Pages already parsed are served from the in-memory LRU; the rest are read
+    from disk and kept there for later calls.
+
+    Args:
+        cache_path: Cache directory of the paper
+        pages: Optional list of 0-based page numbers. If None, loads all pages.
+               Out-of-range and duplicate page numbers are skipped.
+
+    Returns:
+        List of page chunks for the requested pages in ascending page order, or
+        None if the paper is not cached or one of the requested pages is missing/invalid.
+    """
+    entry = _mem_cache_get(cache_path)
+    if entry is None:
+        page_count = _load_page_count(cache_path)
+        if page_count is None:
+            return None
+        entry = _mem_cache_put(cache_path, _CachedPaper(page_count=page_count))
+
+    if pages is None:
+        page_nums = range(entry.page_count)
+    else:
+        # Sorted, de-duplicated so each page file is read once, in order
+        page_nums = sorted({page_num for page_num in pages if 0 <= page_num < entry.page_count})
+
+    page_chunks = []
+    for page_num in page_nums:
+        chunk = entry.pages.get(page_num)
+        if chunk is None:
+            try:
+                chunk = orjson.loads(_read_page_file(cache_path, page_num))
+            except (orjson.JSONDecodeError, IOError, EOFError, zlib.error):
+                return None
+
+            if not isinstance(chunk, dict):
+                return None
+            entry.pages[page_num] = chunk
+        page_chunks.append(chunk)
+
+    return page_chunks
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write a file via a temp file and os.replace so readers never see a partial write."""
+    # A unique temp name, so concurrent writers (threads or server processes) never share one
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _save_page_count(cache_path: Path, page_count: int) -> None:
+    """Save the page count to the cache metadata."""
+    cache_path.mkdir(parents=True, exist_ok=True)
+    _atomic_write_bytes(cache_path / "meta.json", orjson.dumps({"page_count": page_count}))
+
+
+def _write_page_files(cache_path: Path, page_chunks: list[dict]) -> None:
+    """
+    Write page chunks to disk, one file per page plus a meta.json with the page count.
+
+    Compressing and writing a large paper is blocking, so async callers should run
+    this in a worker thread (e.g. via asyncio.to_thread).
+    """
+    cache_path.mkdir(parents=True, exist_ok=True)
+
+    for page_num, chunk in enumerate(page_chunks):
+        # Page markdown compresses well; a low level keeps writes cheap
+        data = gzip.compress(orjson.dumps(chunk), compresslevel=3)
+        _atomic_write_bytes(_get_page_file(cache_path, page_num), data)
+
+    # Written last so a paper only counts as cached once all its pages are on disk
+    _save_page_count(cache_path, len(page_chunks))
+
+
+def _save_to_cache(cache_path: Path, page_chunks: list[dict]) -> None:
+    """Save page chunks to the disk cache and the in-memory cache."""
+    _write_page_files(cache_path, page_chunks)
+    _mem_cache_put(
+        cache_path,
+        _CachedPaper(page_count=len(page_chunks), pages=dict(enumerate(page_chunks))),
+    )
+
+
+def _extract_page_chunks(pdf_data: bytes) -> list[dict]:
+    """
+    Extract markdown page chunks from PDF bytes.
+
+    This is CPU-bound and blocking, so async callers should run it in a worker
+    thread (e.g. via asyncio.to_thread) to keep the event loop responsive.
+    """
+    # Open PDF from memory stream
+    doc = pymupdf.Document(stream=pdf_data)
+    try:
+        # Extract markdown with page_chunks=True for caching; only the text is
+        # needed, so never write or inline figure images
+        return pymupdf4llm.to_markdown(
+            doc,
+            page_chunks=True,
+            show_progress=False,
+            write_images=False,
+            embed_images=False,
+        )
+    finally:
+        doc.close()
 
 
 def _extract_pages_content(page_chunks: list[dict], pages: list[int] | None) -> str:
@@ -143,19 +350,18 @@ def _extract_pages_content(page_chunks: list[dict], pages: list[int] | None) ->
     Args:
         page_chunks: List of page chunk dictionaries from pymupdf4llm
         pages: Optional list of 0-based page numbers. If None, returns all pages.
+               Out-of-range and duplicate page numbers are skipped.
 
     Returns:
-        Combined markdown content for the requested pages.
+        Combined markdown content for the requested pages, in ascending page order.
     """
     if pages is None:
         # Return all pages
         return "\n\n".join(chunk.get("text", "") for chunk in page_chunks)
 
     # Filter to requested pages (0-based index)
-    content_parts = []
-    for page_num in pages:
-        if 0 <= page_num < len(page_chunks):
-            content_parts.append(page_chunks[page_num].get("text", ""))
+    wanted = sorted({page_num for page_num in pages if 0 <= page_num < len(page_chunks)})
+    content_parts = [page_chunks[page_num].get("text", "") for page_num in wanted]
 
     return "\n\n".join(content_parts)
 
@@ -179,7 +385,8 @@ async def search_arxiv(ctx: Context, query: str, limit: int = DEFAULT_RESULT_LIM
         if not papers:
             return "No papers found matching your query."
 
-        return json.dumps(papers, indent=2)
+        # Compact JSON: the result is parsed by the client, not read by a human
+        return orjson.dumps(papers).decode()
     except Exception as e:
         return f"Error searching arXiv: {str(e)}"
 
@@ -194,7 +401,8 @@ async def get_paper_content(
 
     This tool fetches the PDF of a paper from arXiv and extracts its content
     to markdown format using pymupdf4llm for high-quality text extraction.
-    Results are cached as JSON page chunks for efficient subsequent access.
+    Results are cached as one JSON file per page, so later calls only read the
+    pages they ask for.
 
     Args:
         ctx: The MCP server provided context
@@ -203,40 +411,37 @@ async def get_paper_content(
     """
     try:
         cache_dir = os.getenv("JSON_CACHE_DIR", DEFAULT_JSON_CACHE_DIR)
-        cache_file = _get_cache_path(paper_id, cache_dir)
+        cache_path = _get_cache_path(paper_id, cache_dir)
 
-        # Try to load from cache first
-        page_chunks = _load_from_cache(cache_file)
+        # Try to load the requested pages from cache first
+        page_chunks = _load_from_cache(cache_path, pages)
 
         if page_chunks is not None:
-            # Cache hit - extract requested pages
-            return _extract_pages_content(page_chunks, pages)
+            # Cache hit - page_chunks only holds the requested pages
+            return _extract_pages_content(page_chunks, None)
 
-        # Cache miss - download and process PDF
-        session = ctx.request_context.lifespan_context.session
-        pdf_url = f"http://arxiv.org/pdf/{paper_id}"
+        # Cache miss - process the PDF get_paper_page_count kept, or download it
+        pdf_file = _get_pdf_file(cache_path)
+        try:
+            pdf_data = await asyncio.to_thread(pdf_file.read_bytes)
+        except FileNotFoundError:
+            session = ctx.request_context.lifespan_context.session
+            pdf_url = f"https://arxiv.org/pdf/{paper_id}"
 
-        async with session.get(pdf_url, timeout=aiohttp.ClientTimeout(total=120)) as response:
-            if response.status != 200:
-                return f"Failed to fetch PDF: HTTP {response.status}"
+            async with session.get(pdf_url, timeout=PDF_DOWNLOAD_TIMEOUT) as response:
+                if response.status != 200:
+                    return f"Failed to fetch PDF: HTTP {response.status}"
 
-            pdf_data = await response.read()
+                pdf_data = await response.read()
 
-        # Open PDF from memory stream
-        doc = pymupdf.Document(stream=pdf_data)
+        # Extract page chunks off the event loop so other requests are not stalled
+        page_chunks = await asyncio.to_thread(_extract_page_chunks, pdf_data)
 
-        # Extract markdown with page_chunks=True for caching
-        page_chunks = pymupdf4llm.to_markdown(
-            doc,
-            page_chunks=True,
-            show_progress=False,
-        )
-
-        # Close the document
-        doc.close()
-
-        # Save to cache
-        _save_to_cache(cache_file, page_chunks)
+        # Save to cache off the event loop, then to the in-memory cache on it;
+        # the PDF is not needed once its pages are cached
+        await asyncio.to_thread(_write_page_files, cache_path, page_chunks)
+        _mem_cache_put(cache_path, _CachedPaper(page_count=len(page_chunks), pages=dict(enumerate(page_chunks))))
+        pdf_file.unlink(missing_ok=True)
 
         # Extract and return requested pages
         return _extract_pages_content(page_chunks, pages)
@@ -263,49 +468,43 @@ async def get_paper_page_count(
     """
     try:
         cache_dir = os.getenv("JSON_CACHE_DIR", DEFAULT_JSON_CACHE_DIR)
-        cache_file = _get_cache_path(paper_id, cache_dir)
+        cache_path = _get_cache_path(paper_id, cache_dir)
 
-        # Try to load from cache first
-        page_chunks = _load_from_cache(cache_file)
+        # Try to read the page count from the cache metadata first
+        page_count = _load_page_count(cache_path)
 
-        if page_chunks is not None:
-            return json.dumps({
+        if page_count is not None:
+            return orjson.dumps({
                 "paper_id": paper_id,
-                "page_count": len(page_chunks),
+                "page_count": page_count,
                 "cached": True
-            })
+            }).decode()
 
-        # Cache miss - need to download to get page count
+        # Cache miss - need to download to get page count. Markdown extraction is
+        # left to get_paper_content, which fills in the page files on demand from
+        # the PDF kept here, so the paper is downloaded only once.
         session = ctx.request_context.lifespan_context.session
-        pdf_url = f"http://arxiv.org/pdf/{paper_id}"
+        pdf_url = f"https://arxiv.org/pdf/{paper_id}"
 
-        async with session.get(pdf_url, timeout=aiohttp.ClientTimeout(total=120)) as response:
+        async with session.get(pdf_url, timeout=PDF_DOWNLOAD_TIMEOUT) as response:
             if response.status != 200:
                 return f"Failed to fetch PDF: HTTP {response.status}"
 
             pdf_data = await response.read()
 
-        # Open PDF from memory stream
-        doc = pymupdf.Document(stream=pdf_data)
-
-        # Extract markdown with page_chunks=True for caching
-        page_chunks = pymupdf4llm.to_markdown(
-            doc,
-            page_chunks=True,
-            show_progress=False,
-        )
-
-        page_count = doc.page_count
-        doc.close()
+        # Opening the document is enough to read the page count
+        with pymupdf.Document(stream=pdf_data) as doc:
+            page_count = doc.page_count
 
-        # Save to cache for future use
-        _save_to_cache(cache_file, page_chunks)
+        # Save the page count for future use, and keep the PDF for get_paper_content
+        _save_page_count(cache_path, page_count)
+        await asyncio.to_thread(_atomic_write_bytes, _get_pdf_file(cache_path), pdf_data)
 
-        return json.dumps({
+        return orjson.dumps({
             "paper_id": paper_id,
             "page_count": page_count,
             "cached": False
-        })
+        }).decode()
 
     except asyncio.TimeoutError:
         return f"Error: Timeout while fetching paper {paper_id}"
@@ -0,0 +1,15 @@
+from .io import load_markdown_content
+from .llm_cache import llm_cache_key, llm_model_id, load_cached_llm_result, save_cached_llm_result
+from .markdown import compact_for_llm
+from .ratelimit import LLM_RATE_LIMITER, AsyncLimiter
+
+__all__ = [
+    "AsyncLimiter",
+    "LLM_RATE_LIMITER",
+    "compact_for_llm",
+    "llm_cache_key",
+    "llm_model_id",
+    "load_cached_llm_result",
+    "load_markdown_content",
+    "save_cached_llm_result",
+]
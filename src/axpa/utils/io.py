@@ -0,0 +1,21 @@
+import functools
+import os
+from pathlib import Path
+
+# Markdown files kept in memory; scoring and summarization read the same files
+MARKDOWN_CACHE_SIZE = 128
+
+
+@functools.lru_cache(maxsize=MARKDOWN_CACHE_SIZE)
+def _read_markdown(path: str, mtime_ns: int, size: int) -> str:
+    # mtime_ns and size are only part of the cache key, so an edited file is read again
+    return Path(path).read_text(encoding="utf-8")
+
+
+def load_markdown_content(markdown_path: str) -> str | None:
+    """Load markdown content from file path."""
+    try:
+        stat = os.stat(markdown_path)
+        return _read_markdown(markdown_path, stat.st_mtime_ns, stat.st_size)
+    except Exception:
+        return None
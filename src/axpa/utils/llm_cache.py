@@ -0,0 +1,49 @@
+import hashlib
+import os
+from pathlib import Path
+
+import orjson
+
+# Default directory for cached LLM results, keyed by a hash of their full prompt
+DEFAULT_LLM_CACHE_DIR = "./outputs/llm_cache"
+
+
+def _cache_dir() -> Path:
+    return Path(os.getenv("AXPA_LLM_CACHE_DIR", DEFAULT_LLM_CACHE_DIR))
+
+
+def llm_cache_key(*parts: object) -> str:
+    """Content hash of one LLM request; changes whenever any of its parts (prompt, content, round, ...) do."""
+    hasher = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        hasher.update(str(part).encode())
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+def llm_model_id(llm_factory, context) -> str:
+    """Identify the model behind an LLM factory (its provider endpoint and default model), for cache keys."""
+    get_provider_config = getattr(llm_factory, "get_provider_config", None)
+    provider_config = get_provider_config(context) if get_provider_config is not None else None
+    factory_name = getattr(llm_factory, "__qualname__", repr(llm_factory))
+    base_url = getattr(provider_config, "base_url", None)
+    default_model = getattr(provider_config, "default_model", None)
+    return f"{factory_name}:{base_url}:{default_model}"
+
+
+def load_cached_llm_result(key: str) -> dict | None:
+    """Load a cached LLM result, or None on a miss (or an unreadable entry)."""
+    try:
+        return orjson.loads((_cache_dir() / f"{key}.json").read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def save_cached_llm_result(key: str, data: dict) -> None:
+    """Save an LLM result to the cache, atomically so readers never see a partial file."""
+    cache_dir = _cache_dir()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_file = cache_dir / f"{key}.json"
+    tmp_file = cache_file.with_suffix(".json.tmp")
+    tmp_file.write_bytes(orjson.dumps(data))
+    os.replace(tmp_file, cache_file)
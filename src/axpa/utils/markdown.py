@@ -0,0 +1,53 @@
+import os
+import re
+
+# Markdown longer than this is compacted before it is embedded in an LLM prompt (~4 chars per token)
+MARKDOWN_MAX_CHARS = int(os.getenv("AXPA_MARKDOWN_MAX_CHARS", "80000"))
+
+# Sections kept in full when compacting; matched against the lowercased heading text
+KEY_SECTIONS = ("abstract", "introduction", "method", "experiment", "conclusion")
+
+_HEADING_SPLIT = re.compile(r"^(?=#{1,6} )", re.MULTILINE)
+_HEADING = re.compile(r"(#{1,6}) +(.*)")
+_NUMBERED_SECTION = re.compile(r"(\d+|[ivx]+)\.? ")
+
+
+def compact_for_llm(md: str, max_chars: int = MARKDOWN_MAX_CHARS) -> str:
+    """
+    Shorten oversize paper markdown for an LLM prompt.
+
+    Markdown within max_chars is returned unchanged. Otherwise the text before the first
+    heading (title, authors, often the abstract) and the key sections (with their subsections)
+    are kept in full, other sections are reduced to their heading, and the result is cut at
+    max_chars if it is still too long.
+    """
+    if len(md) <= max_chars:
+        return md
+
+    parts = []
+    keep_level = None
+    for section in _HEADING_SPLIT.split(md):
+        heading = _HEADING.match(section)
+        if heading is None:
+            # Text before the first heading
+            parts.append(section)
+            continue
+
+        level = len(heading.group(1))
+        title = heading.group(2).strip("* ").lower()
+        if any(key in title for key in KEY_SECTIONS):
+            keep_level = level
+        elif keep_level is None or level <= keep_level or _NUMBERED_SECTION.match(title):
+            # Not a subsection of a kept section; heading levels from PDF extraction are
+            # unreliable, so a numbered top-level section ("2 Related Work") never is one
+            keep_level = None
+
+        if keep_level is not None:
+            parts.append(section)
+        else:
+            parts.append(f"{heading.group(0).rstrip()}\n\n[Section omitted]\n\n")
+
+    compacted = "".join(parts)
+    if len(compacted) > max_chars:
+        compacted = compacted[:max_chars] + "\n\n[Truncated]\n"
+    return compacted
@@ -0,0 +1,57 @@
+import asyncio
+import os
+import time
+
+
+class AsyncLimiter:
+    """
+    Token-bucket rate limiter for async code.
+
+    Allows max_rate acquisitions per time_period seconds. Up to max_rate
+    acquisitions go through at once after an idle spell; beyond that, callers
+    wait (in arrival order) until the bucket refills.
+
+    Each caller reserves its token on arrival and then sleeps until it is due,
+    so waiters sleep concurrently. The limiter holds no asyncio primitives and
+    can be shared across event loops (e.g. successive asyncio.run calls).
+
+    Usage:
+        limiter = AsyncLimiter(4, 12)
+        async with limiter:
+            ...
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._rate_per_sec = max_rate / time_period
+        self._tokens = max_rate
+        self._last_refill = time.monotonic()
+
+    def _reserve(self) -> float:
+        """Take a token, possibly going into debt; returns the seconds until it is available."""
+        now = time.monotonic()
+        self._tokens = min(self.max_rate, self._tokens + (now - self._last_refill) * self._rate_per_sec)
+        self._last_refill = now
+        self._tokens -= 1
+        return max(0.0, -self._tokens / self._rate_per_sec)
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        # No await between refilling and taking the token, so no lock is needed
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+# Shared by every LLM stage so the provider's requests-per-minute limit holds across the
+# whole workflow. Each generate_* call takes one token; tool-using calls may issue more
+# requests than that, so leave headroom below the provider limit.
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("AXPA_LLM_RPM", "500"))
+LLM_RATE_LIMITER = AsyncLimiter(LLM_REQUESTS_PER_MINUTE, 60.0)
@@ -20,23 +20,7 @@
 #         return None
 
 
-# async def _retry_async(
-#     fn: Callable[[], Coroutine[Any, Any, Any]],
-#     *,
-#     name: str,
-#     retries: int = 5,
-#     delay_time: float = 1
-# ) -> Any:
-#     last_exc: Optional[BaseException] = None
-#     for attempt in range(1, retries + 1):
-#         try:
-#             return await fn()
-#         except Exception as e:
-#             last_exc = e
-#             if attempt >= retries:
-#                 break
-#             await asyncio.sleep(delay_time)
-#     raise RuntimeError(f"{name} failed after {retries} attempts") from last_exc
+# Retries go through the shared tenacity helper: axpa.workflows.stages.retry._retry_async
 
 
 # async def _llm_choose_categories(llm: OpenAIAugmentedLLM, query: str) -> list[str]:
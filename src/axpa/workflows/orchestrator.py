@@ -1,9 +1,13 @@
 import os
 os.environ["TESSDATA_PREFIX"] = "./tessdata/best"
 
+import asyncio
+from operator import attrgetter
 from mcp_agent.app import MCPApp
 from mcp_agent.workflows.llm.augmented_llm_openai import OpenAIAugmentedLLM
 from .stages import *
+from axpa.agents.connection_keeper import create_connection_keeper_agent
+from .stages.paper_fetching import create_session as create_arxiv_session
 from datetime import datetime, timedelta
 from axpa.outputs.data_models import WorkflowResult
 from axpa.configs import OrchestratorConfig
@@ -24,7 +28,9 @@ async def run_arxiv_analysis_workflow(
     """
     app = MCPApp(name="arxiv_analysis")
 
-    async with app.run() as agent_app:
+    # The connection keeper stays entered for the whole run, so MCP servers started by one
+    # stage's agents are reused by the next stage instead of being restarted
+    async with app.run() as agent_app, create_connection_keeper_agent(agent_app.context):
         context = agent_app.context
         logger = context.logger
 
@@ -50,40 +56,52 @@ async def run_arxiv_analysis_workflow(
         paper_start_time = config.paper_start_time
         paper_end_time = config.paper_end_time
 
-        logger.info("orchestrator.stage2_start", data={"stage": "paper_fetching"})
-        papers = await fetch_papers_from_categories_stage(
-            categories=categories,
-            limit=config.search_limit,
-            context=context,
-            paper_start_time=paper_start_time,
-            paper_end_time=paper_end_time,
-        )
-        logger.info("orchestrator.stage2_complete", data={"total_papers": len(papers)})
-
-        # Stage 3: Filter papers
-        logger.info("orchestrator.stage3_start", data={"stage": "paper_filtering"})
-        filtered_papers = await filter_papers_stage(
-            papers=papers,
-            query=config.query,
-            context=context,
-            llm_factory=llm_factory,
-        )
-        logger.info("orchestrator.stage3_complete", data={
-            "filtered_papers": len(filtered_papers),
-            "total_papers": len(papers),
-            "filter_rate": f"{len(filtered_papers) / len(papers) * 100:.1f}%" if papers else "0%"
-        })
-
-        # Stage 4: Download papers and extract to markdown
-        logger.info("orchestrator.stage4_start", data={"stage": "paper_downloading"})
-        downloaded_papers = await download_papers_stage(
-            papers=filtered_papers,
-            context=context,
-        )
-        logger.info("orchestrator.stage4_complete", data={
-            "total_papers": len(downloaded_papers),
-            "with_markdown": len([p for p in downloaded_papers if p.markdown_path])
-        })
+        # Bound how many categories are fetched from arXiv at the same time
+        fetch_semaphore = asyncio.Semaphore(int(os.getenv("AXPA_FETCH_CONCURRENCY", "8")))
+
+        # Bound how many LLM requests are in flight at the same time, shared across stages
+        llm_semaphore = asyncio.Semaphore(int(os.getenv("AXPA_LLM_CONCURRENCY", "8")))
+
+        # One pooled session serves every arXiv request of stages 2-4
+        async with create_arxiv_session() as arxiv_session:
+            logger.info("orchestrator.stage2_start", data={"stage": "paper_fetching"})
+            papers = await fetch_papers_from_categories_stage(
+                categories=categories,
+                limit=config.search_limit,
+                context=context,
+                paper_start_time=paper_start_time,
+                paper_end_time=paper_end_time,
+                semaphore=fetch_semaphore,
+                session=arxiv_session,
+            )
+            logger.info("orchestrator.stage2_complete", data={"total_papers": len(papers)})
+
+            # Stage 3: Filter papers
+            logger.info("orchestrator.stage3_start", data={"stage": "paper_filtering"})
+            filtered_papers = await filter_papers_stage(
+                papers=papers,
+                query=config.query,
+                context=context,
+                llm_factory=llm_factory,
+                semaphore=llm_semaphore,
+            )
+            logger.info("orchestrator.stage3_complete", data={
+                "filtered_papers": len(filtered_papers),
+                "total_papers": len(papers),
+                "filter_rate": f"{len(filtered_papers) / len(papers) * 100:.1f}%" if papers else "0%"
+            })
+
+            # Stage 4: Download papers and extract to markdown
+            logger.info("orchestrator.stage4_start", data={"stage": "paper_downloading"})
+            downloaded_papers = await download_papers_stage(
+                papers=filtered_papers,
+                context=context,
+                session=arxiv_session,
+            )
+            logger.info("orchestrator.stage4_complete", data={
+                "total_papers": len(downloaded_papers),
+                "with_markdown": len([p for p in downloaded_papers if p.markdown_path])
+            })
 
         # Stage 5: Score papers (2 rounds)
         logger.info("orchestrator.stage5_start", data={"stage": "paper_scoring"})
@@ -92,24 +110,28 @@ async def run_arxiv_analysis_workflow(
             query=config.query,
             context=context,
             llm_factory=llm_factory,
+            semaphore=llm_semaphore,
+            early_exit_low=config.score_early_exit_low,
+            early_exit_high=config.score_early_exit_high,
         )
+        accepted_papers = [sp for sp in scored_papers if sp.overall_recommendation == "Accept"]
         logger.info("orchestrator.stage5_complete", data={
             "scored_papers": len(scored_papers),
             "downloaded_papers": len(downloaded_papers),
             "avg_score_mean": sum(sp.avg_score for sp in scored_papers) / len(scored_papers) if scored_papers else 0,
-            "accepted_papers": len([sp for sp in scored_papers if sp.overall_recommendation == "Accept"]),
+            "accepted_papers": len(accepted_papers),
         })
 
         # Stage 6: Select top-k accepted papers and summarize
-        # Filter by acceptance first, then sort by score
-        accepted_papers = [sp for sp in scored_papers if sp.overall_recommendation == "Accept"]
-        top_papers = sorted(accepted_papers, key=lambda p: p.avg_score, reverse=True)[:config.top_k]
+        # Filter by acceptance first (above), then sort by score
+        top_papers = sorted(accepted_papers, key=attrgetter("avg_score"), reverse=True)[:config.top_k]
 
         logger.info("orchestrator.stage6_start", data={"stage": "paper_summarization"})
         summaries = await summarize_papers_stage(
             papers=top_papers,
             context=context,
             llm_factory=llm_factory,
+            semaphore=llm_semaphore,
         )
         logger.info("orchestrator.stage6_complete", data={"summaries_count": len(summaries)})
 
@@ -126,7 +148,9 @@ async def run_arxiv_analysis_workflow(
 
         if additional_html_formatting:
             logger.info("orchestrator.stage7_start", data={"stage": "additional_html_formatting"})
-            html_format_result = await html_formatting_stage(result, context, llm_factory)
+            html_format_result = await html_formatting_stage(
+                result, context, llm_factory, semaphore=llm_semaphore
+            )
             if html_format_result:
                 result = html_format_result
             logger.info("orchestrator.stage7_complete", data={"stage": "additional_html_formatting"})
@@ -4,6 +4,9 @@ from axpa.agents.prompts import validate_category_codes
 from axpa.outputs.data_models import SelectedCategories
 import json
 
+# Fallback when the model returns no usable codes; both are valid arXiv codes.
+DEFAULT_CATEGORIES = ("cs.SE", "cs.AI")
+
 async def select_categories_stage(
     query: str,
     context,
@@ -30,10 +33,6 @@ async def select_categories_stage(
     logger = context.logger
     logger.info("category_selection.response", data={"response": response})
 
-    # Remove <think>...</think> if exists
-    if "<think>" in response:
-        response = response.split("</think>")[1].strip()
-
     try:
         selected_categories = response.categories
     except Exception:
@@ -45,7 +44,6 @@ async def select_categories_stage(
     valid, _ = validate_category_codes(categories)
     if not valid:
         logger.warning("category_selection.invalid_categories", data={"categories": categories})
-        valid = ["cs.SE", "cs.AI"]
-        valid, _ = validate_category_codes(valid)
+        valid = list(DEFAULT_CATEGORIES)
 
     return valid[:6]
\ No newline at end of file
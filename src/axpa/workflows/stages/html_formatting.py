@@ -1,20 +1,102 @@
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Optional
 import asyncio
+import hashlib
+import html
+import os
+import re
 
 from axpa.agents.html_converter import create_html_formatter_agent
+from axpa.utils import LLM_RATE_LIMITER, llm_model_id
 from axpa.outputs.data_models import WorkflowResult, HTMLFormatResult, PaperSummary
+from axpa.workflows.stages.retry import LLM_RETRIES, TRANSIENT_LLM_ERRORS, EmptyLLMResponseError, _retry_async
 from mcp_agent.workflows.llm.augmented_llm import RequestParams
 
 
-async def html_formatting_stage(workflow_result: WorkflowResult, context, llm_factory) -> Optional[HTMLFormatResult]:
+# Default directory for formatted HTML sections, keyed by a hash of their source
+DEFAULT_HTML_CACHE_DIR = "./outputs/html_cache"
+
+# Sections with no real content are rendered locally instead of being sent to the LLM
+PLACEHOLDER_SECTIONS = frozenset({"n/a", "na", "none", "tbd", "-"})
+MIN_SECTION_LENGTH = 8
+
+FIELD_MARKER_PATTERN = re.compile(r"^###\s*FIELD:\s*(\w+)\s*$", re.MULTILINE)
+
+
+def _split_field_sections(response: str) -> dict[str, str]:
+    """Split a batched response on its `### FIELD: <name>` marker lines."""
+    matches = list(FIELD_MARKER_PATTERN.finditer(response))
+    sections = {}
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(response)
+        sections[match.group(1)] = response[match.end():end].strip()
+    return sections
+
+
+def _placeholder_section_html(source: str) -> Optional[str]:
+    """Return static HTML for an empty or placeholder section, or None if it needs formatting."""
+    text = (source or "").strip()
+    if len(text) >= MIN_SECTION_LENGTH and text.lower() not in PLACEHOLDER_SECTIONS:
+        return None
+    return f'<div class="section"><p>{html.escape(text or "N/A")}</p></div>'
+
+
+def _html_cache_key(model_id: str, instruction: str, field_name: str, description: str, source: str) -> str:
+    """Content hash of one formatting request; changes whenever the model, instruction, prompt or source text does."""
+    payload = f"{model_id}\0{instruction}\0{field_name}\0{description}\0{source}".encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _load_cached_html(cache_dir: Path, key: str) -> Optional[str]:
+    """Load a formatted section from the cache, or None on a miss."""
+    try:
+        return (cache_dir / f"{key}.html").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def _save_cached_html(cache_dir: Path, key: str, html_text: str) -> None:
+    """Save a formatted section to the cache, atomically so readers never see a partial file."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_file = cache_dir / f"{key}.html"
+    tmp_file = cache_file.with_suffix(".html.tmp")
+    tmp_file.write_text(html_text, encoding="utf-8")
+    os.replace(tmp_file, cache_file)
+
+
+async def html_formatting_stage(
+    workflow_result: WorkflowResult,
+    context,
+    llm_factory,
+    semaphore: asyncio.Semaphore | None = None,
+) -> Optional[HTMLFormatResult]:
+    """
+    Stage 7: Format the paper summaries as HTML.
+
+    Args:
+        workflow_result: Result of the workflow whose summaries are formatted
+        context: MCP app context
+        llm_factory: LLM factory
+        semaphore: Optional semaphore bounding concurrent LLM calls.
+                   If None, every call is issued at once.
+    """
     logger = context.logger
     logger.info("html_formatting.start", data={"total_summaries": len(workflow_result.summaries)})
 
+    # Every prompt is self-contained, so calls skip the shared history and can run concurrently
     request_params = RequestParams(
         maxTokens=16384,
-        temperature=0.2
+        temperature=0.2,
+        use_history=False,
+    )
+
+    # All six sections come back in one response, so allow for their combined length
+    batch_request_params = RequestParams(
+        maxTokens=16384 * 2,
+        temperature=0.2,
+        use_history=False,
     )
 
     formatting_prompts = [
@@ -26,35 +108,137 @@ async def html_formatting_stage(workflow_result: WorkflowResult, context, llm_fa
         ("overall_summary", "Format the overall summary into a HTML section."),
     ]
 
-    async def format_html_summary(paper_summary: PaperSummary, llm) -> PaperSummary:
+    # Cached sections are only reused for the same model and agent instruction
+    model_id = llm_model_id(llm_factory, context)
+    html_formatter_agent = create_html_formatter_agent()
+
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(len(workflow_result.summaries), 1) * len(formatting_prompts))
+
+    cache_dir = Path(os.getenv("HTML_CACHE_DIR", DEFAULT_HTML_CACHE_DIR))
+
+    async def generate_str(llm, message: str, params: RequestParams, name: str) -> str:
+        """Generate HTML under the semaphore and rate limiter, retrying transient errors and empty responses."""
+        async def attempt() -> str:
+            async with semaphore, LLM_RATE_LIMITER:
+                html_text = await llm.generate_str(message=message, request_params=params)
+            if not html_text.strip():
+                raise EmptyLLMResponseError(f"empty response from {name}")
+            return html_text
+
+        return await _retry_async(attempt, name=name, retries=LLM_RETRIES, retry_on=TRANSIENT_LLM_ERRORS)
+
+    async def format_html_fields_batched(
+        paper_summary: PaperSummary,
+        llm,
+        prompts: list[tuple[str, str]],
+    ) -> Optional[dict[str, str]]:
+        """Format the given sections in a single call; returns None if any section is missing from the response."""
+        sections = "\n\n".join(
+            f"### FIELD: {field_name}\n{getattr(paper_summary, field_name)}"
+            for field_name, _ in prompts
+        )
+        message = (
+            "Format each of the following sections into a HTML section.\n"
+            "Return every section in the same order. Start each one with its marker line "
+            "exactly as given (e.g. `### FIELD: research_gap`), followed only by the HTML snippet of that section.\n\n"
+            f"{sections}"
+        )
+
         try:
-            llm.history.clear()
+            response = await generate_str(
+                llm, message, batch_request_params, f"format_html_batch({paper_summary.score.paper_id})"
+            )
+        except Exception as e:
+            logger.warning("html_formatting.batch_error", data={
+                "paper_id": paper_summary.score.paper_id,
+                "error": str(e),
+            })
+            return None
 
+        html_format_generated = _split_field_sections(response)
+        if any(not html_format_generated.get(field_name) for field_name, _ in prompts):
+            return None
+        return {field_name: html_format_generated[field_name] for field_name, _ in prompts}
+
+    async def format_html_fields_one_by_one(
+        paper_summary: PaperSummary,
+        llm,
+        prompts: list[tuple[str, str]],
+    ) -> dict[str, str]:
+        async def format_field(field_name: str, description: str) -> str:
+            logger.debug("html_formatting.format_html_prompt", data={
+                "paper_id": paper_summary.score.paper_id,
+                "field": field_name,
+            })
+
+            html_text = await generate_str(
+                llm,
+                f"{description}\n\n{getattr(paper_summary, field_name)}",
+                request_params,
+                f"format_html({paper_summary.score.paper_id}, {field_name})",
+            )
+
+            logger.debug("html_formatting.format_html_complete", data={
+                "paper_id": paper_summary.score.paper_id,
+                "field": field_name,
+                "length": len(html_text),
+            })
+            return html_text
+
+        html_texts = await asyncio.gather(
+            *[format_field(field_name, description) for field_name, description in prompts]
+        )
+        return {field_name: html_text for (field_name, _), html_text in zip(prompts, html_texts)}
+
+    async def format_html_summary(paper_summary: PaperSummary, llm) -> PaperSummary:
+        try:
             logger.info("html_formatting.format_html_start", data={
                 "paper_id": paper_summary.score.paper_id,
                 "title": paper_summary.score.paper.title[:60],
             })
 
+            # Reuse sections formatted in earlier runs and render empty ones locally;
+            # only the rest go to the LLM
             html_format_generated = {}
+            cache_keys = {}
+            missing_prompts = []
             for field_name, description in formatting_prompts:
-                logger.debug("html_formatting.format_html_prompt", data={
-                    "paper_id": paper_summary.score.paper_id,
-                    "field": field_name,
-                })
-                
-                html_text = await llm.generate_str(
-                    message=f"{description}\n\n{getattr(paper_summary, field_name)}", 
-                    request_params=request_params
+                source = getattr(paper_summary, field_name)
+                placeholder_html = _placeholder_section_html(source)
+                if placeholder_html is not None:
+                    html_format_generated[field_name] = placeholder_html
+                    continue
+
+                cache_keys[field_name] = _html_cache_key(
+                    model_id, html_formatter_agent.instruction, field_name, description, source
                 )
+                cached_html = _load_cached_html(cache_dir, cache_keys[field_name])
+                if cached_html is None:
+                    missing_prompts.append((field_name, description))
+                else:
+                    html_format_generated[field_name] = cached_html
 
-                html_format_generated[field_name] = html_text
+            logger.debug("html_formatting.cache_lookup", data={
+                "paper_id": paper_summary.score.paper_id,
+                "without_llm": len(html_format_generated),
+                "missing": len(missing_prompts),
+            })
+
+            if missing_prompts:
+                new_html = await format_html_fields_batched(paper_summary, llm, missing_prompts)
+                if new_html is None:
+                    logger.warning("html_formatting.batch_fallback", data={
+                        "paper_id": paper_summary.score.paper_id,
+                    })
+                    new_html = await format_html_fields_one_by_one(paper_summary, llm, missing_prompts)
+
+                for field_name, html_text in new_html.items():
+                    # Never cache an empty section, or it would be served on every later run
+                    if html_text.strip():
+                        _save_cached_html(cache_dir, cache_keys[field_name], html_text)
+                html_format_generated.update(new_html)
 
-                logger.debug("html_formatting.format_html_complete", data={
-                    "paper_id": paper_summary.score.paper_id,
-                    "field": field_name,
-                    "length": len(html_text),
-                })
-            
             html_format_result = PaperSummary(
                 score=paper_summary.score,
                 research_gap=html_format_generated["research_gap"],
@@ -83,7 +267,6 @@ async def html_formatting_stage(workflow_result: WorkflowResult, context, llm_fa
     
     all_html_format_results = []
 
-    html_formatter_agent = create_html_formatter_agent()
     async with html_formatter_agent as agent_ctx:
         llm = await agent_ctx.attach_llm(llm_factory)
 
@@ -1,24 +1,47 @@
 import asyncio
+import contextlib
+import hashlib
+import json
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List
-import requests
+import aiohttp
 import pymupdf.layout
 import pymupdf4llm
 import pymupdf
 from axpa.outputs.data_models import Paper
+from axpa.workflows.stages.retry import RETRYABLE_HTTP_STATUSES, _retry_async
+
+# arXiv tolerates a handful of concurrent PDF downloads per client
+DEFAULT_DOWNLOAD_CONCURRENCY = 4
+
+# Cached markdown files at least this large are trusted without reading them
+MIN_TRUSTED_MARKDOWN_SIZE = 32
+
+# Timeout for downloading one PDF (a per-request timeout replaces the session's)
+PDF_DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=120, connect=10, sock_read=60)
+
+# Size of the chunks a PDF response is streamed to disk in
+PDF_CHUNK_SIZE = 64 * 1024
+
+# In-flight downloads keyed by PDF link, so concurrent requests for the same PDF share one download
+_INFLIGHT_DOWNLOADS: dict[str, asyncio.Future] = {}
 
 
 async def download_papers_stage(
     papers: List[Paper],
     context,
     output_dir: str = "outputs/papers/markdown_cache",
+    semaphore: asyncio.Semaphore | None = None,
+    session: aiohttp.ClientSession | None = None,
 ) -> List[Paper]:
     """
     Stage: Download papers and extract content to markdown.
 
     This stage:
-    1. Downloads PDF for each paper from arXiv
+    1. Downloads PDF for each paper from arXiv (revalidating previously downloaded PDFs)
     2. Extracts content to markdown using pymupdf4llm with layout support
     3. Saves markdown to file and updates paper with markdown_path
     4. Returns updated list of papers with markdown_path set
@@ -27,6 +50,10 @@ async def download_papers_stage(
         papers: List of Paper models to download
         context: MCP agent context for logging
         output_dir: Directory to save markdown files (default: outputs/papers/markdown_cache)
+        semaphore: Optional semaphore bounding concurrent downloads.
+                   If None, up to DEFAULT_DOWNLOAD_CONCURRENCY papers are downloaded at once.
+        session: Optional aiohttp session to download through.
+                 If None, a session is opened for the duration of the stage.
 
     Returns:
         List of Paper models with markdown_path field populated
@@ -42,12 +69,11 @@ async def download_papers_stage(
         "output_dir": str(output_path)
     })
 
-    updated_papers = []
-    successful = 0
-    failed = 0
-    cached = 0
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(DEFAULT_DOWNLOAD_CONCURRENCY)
 
-    for idx, paper in enumerate(papers):
+    async def process_paper(idx: int, paper: Paper, session: aiohttp.ClientSession) -> tuple[Paper, str]:
+        """Return the (possibly updated) paper and its outcome: cached, downloaded or failed."""
         # Check if paper already exists in cache
         safe_id = paper.id.replace("/", "_")
         markdown_file = output_path / f"{safe_id}.md"
@@ -55,21 +81,16 @@ async def download_papers_stage(
         if markdown_file.exists():
             # Verify the cached file is not empty
             try:
-                content = markdown_file.read_text(encoding="utf-8")
-                if content.strip():
-                    # Use cached version
-                    updated_paper = paper.model_copy(update={"markdown_path": str(markdown_file)})
-                    updated_papers.append(updated_paper)
-                    cached += 1
-
+                if await _is_cached_markdown_usable(markdown_file):
                     logger.info("download_papers.cache_hit", data={
                         "paper_id": paper.id,
                         "index": idx + 1,
                         "total": len(papers),
                         "markdown_path": str(markdown_file),
-                        "content_length": len(content)
+                        "content_length": markdown_file.stat().st_size
                     })
-                    continue
+                    # Use cached version
+                    return paper.model_copy(update={"markdown_path": str(markdown_file)}), "cached"
             except Exception as e:
                 logger.warning("download_papers.cache_read_error", data={
                     "paper_id": paper.id,
@@ -85,39 +106,51 @@ async def download_papers_stage(
         })
 
         try:
-            # Download PDF
-            markdown_content = await _download_and_extract_paper(paper, logger)
-
-            if markdown_content:
-                # Save markdown to file
-                with open(markdown_file, "w", encoding="utf-8") as f:
-                    f.write(markdown_content)
-
-                # Update paper with markdown path
-                updated_paper = paper.model_copy(update={"markdown_path": str(markdown_file)})
-                updated_papers.append(updated_paper)
-                successful += 1
-
-                logger.info("download_papers.success", data={
-                    "paper_id": paper.id,
-                    "markdown_path": str(markdown_file),
-                    "content_length": len(markdown_content)
-                })
-            else:
-                updated_papers.append(paper)
-                failed += 1
-
+            # Download PDF and write its markdown straight to the cache file; papers sharing
+            # a PDF link get the markdown file of whichever one downloaded it
+            markdown_file, content_length = await _download_coalesced(
+                paper, session, markdown_file, semaphore, pdf_pool, logger
+            )
         except Exception as e:
             logger.error("download_papers.error", data={
                 "paper_id": paper.id,
                 "error": str(e)
             })
-            updated_papers.append(paper)
-            failed += 1
+            return paper, "failed"
+
+        if not content_length:
+            return paper, "failed"
+
+        logger.info("download_papers.success", data={
+            "paper_id": paper.id,
+            "markdown_path": str(markdown_file),
+            "content_length": content_length
+        })
+
+        # Update paper with markdown path
+        return paper.model_copy(update={"markdown_path": str(markdown_file)}), "downloaded"
 
-        # Rate limiting: small delay between downloads to be respectful to arXiv
-        if idx < len(papers) - 1:
-            await asyncio.sleep(1)
+    # Markdown extraction is CPU-bound, so it runs in worker processes (started on first use).
+    # They are spawned rather than forked, as this process already runs threads.
+    pdf_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn"))
+
+    # Downloads run concurrently, bounded by the semaphore instead of a fixed delay between papers;
+    # an injected session is left open for the caller to close
+    session_context = contextlib.nullcontext(session) if session is not None else aiohttp.ClientSession()
+    try:
+        async with session_context as session:
+            results = await asyncio.gather(
+                *[process_paper(idx, paper, session) for idx, paper in enumerate(papers)]
+            )
+    finally:
+        # Joining the workers blocks, so keep it off the event loop
+        await asyncio.to_thread(pdf_pool.shutdown)
+
+    updated_papers = [paper for paper, _ in results]
+    outcomes = [outcome for _, outcome in results]
+    cached = outcomes.count("cached")
+    successful = outcomes.count("downloaded")
+    failed = outcomes.count("failed")
 
     logger.info("download_papers.complete", data={
         "total_papers": len(papers),
@@ -130,60 +163,259 @@ async def download_papers_stage(
     return updated_papers
 
 
-async def _download_and_extract_paper(paper: Paper, logger) -> str | None:
+async def _is_cached_markdown_usable(markdown_file: Path) -> bool:
     """
-    Download a paper's PDF and extract content to markdown.
+    Check that a cached markdown file has content.
+
+    Files of MIN_TRUSTED_MARKDOWN_SIZE bytes or more are accepted from their size
+    alone; only smaller ones are read (off the event loop) to check for non-whitespace.
+    """
+    size = markdown_file.stat().st_size
+    if size >= MIN_TRUSTED_MARKDOWN_SIZE:
+        return True
+    if size == 0:
+        return False
+
+    content = await asyncio.to_thread(markdown_file.read_text, encoding="utf-8")
+    return bool(content.strip())
+
+
+def _extract_markdown_to_file(pdf_path: str, markdown_file: str) -> int:
+    """
+    Extract markdown from the PDF at pdf_path into markdown_file, one page at a time.
+
+    Pages are appended as they are converted, so peak memory stays around a
+    single page instead of the whole document. The file is written next to its
+    target and moved into place at the end, so an interrupted run never leaves
+    a partial file that looks cached. Kept at module level so it can be pickled
+    and run in the stage's worker processes.
+
+    Returns:
+        Number of characters written (0 means nothing was extracted and no file is left behind)
+    """
+    tmp_file = Path(f"{markdown_file}.{os.getpid()}.tmp")
+    content_length = 0
+
+    # Open the PDF from disk, so it is never copied through Python bytes
+    doc = pymupdf.open(pdf_path)
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            for page_num in range(doc.page_count):
+                page_markdown = pymupdf4llm.to_markdown(
+                    doc,
+                    pages=[page_num],
+                    show_progress=False,
+                    header=True,
+                    footer=True,
+                )
+                f.write(page_markdown)
+                content_length += len(page_markdown)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    finally:
+        # Close the document
+        doc.close()
+
+    if content_length == 0:
+        tmp_file.unlink(missing_ok=True)
+        return 0
+
+    os.replace(tmp_file, markdown_file)
+    return content_length
+
+
+def _get_pdf_cache_files(markdown_file: Path) -> tuple[Path, Path]:
+    """Get the cached PDF and its validator metadata file for a paper's markdown file."""
+    cache_dir = markdown_file.parent
+    return (
+        cache_dir / "pdf" / f"{markdown_file.stem}.pdf",
+        cache_dir / "meta" / f"{markdown_file.stem}.json",
+    )
+
+
+def _load_pdf_cache(pdf_file: Path, meta_file: Path) -> dict | None:
+    """
+    Load the metadata of a cached PDF, or None if missing or the PDF does not match its recorded hash.
+
+    Reading and hashing the whole PDF is blocking, so async callers should run this in a
+    worker thread (e.g. via asyncio.to_thread).
+    """
+    try:
+        pdf_meta = json.loads(meta_file.read_text(encoding="utf-8"))
+        with open(pdf_file, "rb") as f:
+            pdf_sha256 = hashlib.file_digest(f, "sha256").hexdigest()
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if not isinstance(pdf_meta, dict) or pdf_sha256 != pdf_meta.get("pdf_sha256"):
+        return None
+    return pdf_meta
+
+
+def _save_pdf_meta(meta_file: Path, pdf_meta: dict) -> None:
+    """Save a cached PDF's metadata atomically, so a reader never sees a partial file."""
+    tmp_file = meta_file.with_suffix(f".{os.getpid()}.tmp")
+    tmp_file.write_text(json.dumps(pdf_meta), encoding="utf-8")
+    os.replace(tmp_file, meta_file)
+
+
+async def _stream_pdf_to_cache(response: aiohttp.ClientResponse, pdf_file: Path, meta_file: Path) -> None:
+    """
+    Stream a PDF response into the cache with its ETag/Last-Modified validators and content hash.
+
+    The body is written chunk by chunk and hashed as it arrives, so the PDF is
+    never held in memory as a whole.
+    """
+    pdf_file.parent.mkdir(parents=True, exist_ok=True)
+    meta_file.parent.mkdir(parents=True, exist_ok=True)
+
+    pdf_hash = hashlib.sha256()
+    tmp_file = pdf_file.with_suffix(".pdf.tmp")
+    try:
+        with open(tmp_file, "wb") as f:
+            async for chunk in response.content.iter_chunked(PDF_CHUNK_SIZE):
+                f.write(chunk)
+                pdf_hash.update(chunk)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_file, pdf_file)
+
+    pdf_meta = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "pdf_sha256": pdf_hash.hexdigest(),
+    }
+    await asyncio.to_thread(_save_pdf_meta, meta_file, pdf_meta)
+
+
+async def _download_coalesced(
+    paper: Paper,
+    session: aiohttp.ClientSession,
+    markdown_file: Path,
+    semaphore: asyncio.Semaphore,
+    pdf_pool: ProcessPoolExecutor,
+    logger,
+) -> tuple[Path, int | None]:
+    """
+    Download and extract a paper at most once per PDF link at a time.
+
+    The first caller for a link does the work under the semaphore; concurrent
+    callers for the same link wait for its result without taking a slot.
+
+    Returns:
+        Markdown file that was written and its content length (None if it failed)
+    """
+    inflight = _INFLIGHT_DOWNLOADS.get(paper.pdf_link)
+    if inflight is not None:
+        logger.info("download_papers.coalesced", data={
+            "paper_id": paper.id,
+            "pdf_link": paper.pdf_link
+        })
+        return await asyncio.shield(inflight)
+
+    inflight = asyncio.get_running_loop().create_future()
+    _INFLIGHT_DOWNLOADS[paper.pdf_link] = inflight
+    result: tuple[Path, int | None] = (markdown_file, None)
+    try:
+        async with semaphore:
+            content_length = await _download_and_extract_paper(paper, session, markdown_file, pdf_pool, logger)
+        result = (markdown_file, content_length)
+        return result
+    finally:
+        # Waiters see a failure if the download raised or was cancelled
+        inflight.set_result(result)
+        del _INFLIGHT_DOWNLOADS[paper.pdf_link]
+
+
+async def _download_and_extract_paper(
+    paper: Paper,
+    session: aiohttp.ClientSession,
+    markdown_file: Path,
+    pdf_pool: ProcessPoolExecutor,
+    logger,
+) -> int | None:
+    """
+    Download a paper's PDF and extract its content to a markdown file.
 
     Args:
         paper: Paper model with pdf_link
+        session: The aiohttp session used for the download
+        markdown_file: Path the markdown is written to
+        pdf_pool: Worker processes the markdown is extracted in
         logger: Logger instance
 
+    429/5xx responses and connection errors are retried with capped exponential
+    backoff (honoring Retry-After) before the paper is given up on.
+
     Returns:
-        Markdown content string, or None if extraction failed
+        Length of the extracted markdown, or None if download or extraction failed
     """
     try:
-        # Download PDF using requests
         logger.info("download_papers.downloading", data={
             "paper_id": paper.id,
             "pdf_link": paper.pdf_link
         })
 
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: requests.get(paper.pdf_link, timeout=60)
-        )
+        # Revalidate a previously downloaded PDF instead of transferring it again
+        pdf_file, meta_file = _get_pdf_cache_files(markdown_file)
+        pdf_meta = await asyncio.to_thread(_load_pdf_cache, pdf_file, meta_file)
+        headers = {}
+        if pdf_meta is not None:
+            if pdf_meta.get("etag"):
+                headers["If-None-Match"] = pdf_meta["etag"]
+            if pdf_meta.get("last_modified"):
+                headers["If-Modified-Since"] = pdf_meta["last_modified"]
+
+        async def _get_pdf() -> int:
+            async with session.get(
+                paper.pdf_link,
+                headers=headers,
+                timeout=PDF_DOWNLOAD_TIMEOUT,
+            ) as response:
+                # Raise on throttling/server errors so the download is retried with backoff
+                if response.status in RETRYABLE_HTTP_STATUSES:
+                    response.raise_for_status()
+                if response.status == 200:
+                    await _stream_pdf_to_cache(response, pdf_file, meta_file)
+                return response.status
 
-        if response.status_code != 200:
-            logger.warning("download_papers.http_error", data={
+        try:
+            status = await _retry_async(
+                _get_pdf,
+                name=f"GET {paper.pdf_link}",
+                retry_on=(aiohttp.ClientError, asyncio.TimeoutError),
+            )
+        except RuntimeError as e:
+            logger.warning("download_papers.request_error", data={
                 "paper_id": paper.id,
-                "status_code": response.status_code
+                "error": f"{e}: {e.__cause__!r}"
             })
             return None
 
-        pdf_data = response.content
-
-        # Open PDF from memory stream
-        doc = pymupdf.Document(stream=pdf_data)
+        if status == 304 and pdf_meta is not None:
+            logger.info("download_papers.pdf_not_modified", data={"paper_id": paper.id})
+        elif status != 200:
+            logger.warning("download_papers.http_error", data={
+                "paper_id": paper.id,
+                "status_code": status
+            })
+            return None
 
-        markdown_content = pymupdf4llm.to_markdown(
-            doc,
-            show_progress=False,
-            header=True,
-            footer=True,
+        # Extract in a worker process so the event loop keeps serving other downloads
+        loop = asyncio.get_running_loop()
+        content_length = await loop.run_in_executor(
+            pdf_pool, _extract_markdown_to_file, str(pdf_file), str(markdown_file)
         )
+        return content_length or None
 
-        # Close the document
-        doc.close()
-
-        return markdown_content
-
-    except requests.exceptions.Timeout:
+    except asyncio.TimeoutError:
         logger.warning("download_papers.timeout", data={
             "paper_id": paper.id
         })
         return None
-    except requests.exceptions.RequestException as e:
+    except aiohttp.ClientError as e:
         logger.warning("download_papers.request_error", data={
             "paper_id": paper.id,
             "error": str(e)
@@ -1,9 +1,62 @@
 import aiohttp
 import asyncio
-import feedparser
+import contextlib
+import hashlib
+import heapq
+import io
+import json
+import os
+import time
 from datetime import datetime, timezone, timedelta
-from typing import List
+from operator import itemgetter
+from pathlib import Path
+from typing import Iterator, List, Mapping
+from urllib.parse import urlencode
+from lxml import etree
+from axpa.__about__ import __version__
 from axpa.outputs.data_models import Paper
+from axpa.utils import AsyncLimiter
+from axpa.workflows.stages.retry import RETRYABLE_HTTP_STATUSES, _retry_async
+
+# Atom namespace used by the arXiv API feed
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+FEED_NAMESPACES = {"a": "http://www.w3.org/2005/Atom", "arxiv": "http://arxiv.org/schemas/atom"}
+
+# Compiled once: XPath lookups specialized to the arXiv Atom schema, evaluated per <entry>
+_ENTRY_ID = etree.XPath("string(a:id)", namespaces=FEED_NAMESPACES)
+_ENTRY_TITLE = etree.XPath("string(a:title)", namespaces=FEED_NAMESPACES)
+_ENTRY_SUMMARY = etree.XPath("string(a:summary)", namespaces=FEED_NAMESPACES)
+_ENTRY_PUBLISHED = etree.XPath("string(a:published)", namespaces=FEED_NAMESPACES)
+_ENTRY_AUTHORS = etree.XPath("a:author/a:name/text()", namespaces=FEED_NAMESPACES, smart_strings=False)
+_ENTRY_CATEGORIES = etree.XPath("a:category/@term", namespaces=FEED_NAMESPACES, smart_strings=False)
+
+# Format of arXiv's UTC timestamps (e.g. 2025-01-31T18:59:59Z); equal-format strings sort chronologically
+ARXIV_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# Minute-resolution format of submittedDate ranges in arXiv API queries
+ARXIV_QUERY_DATE_FORMAT = "%Y%m%d%H%M"
+
+# submittedDate ranges are widened to whole steps, so queries of runs within the same step
+# share a URL (and so a feed cache entry)
+ARXIV_QUERY_RANGE_STEP = timedelta(hours=1)
+
+# Session-wide timeouts bound connecting and stalled reads only; a total would also cut off
+# large feed pages and PDFs fetched on the shared session
+SESSION_TIMEOUT = aiohttp.ClientTimeout(connect=10, sock_read=60)
+
+# Timeout for one arXiv API feed request (a per-request timeout replaces the session's)
+FEED_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=120, connect=10, sock_read=60)
+
+# arXiv asks API clients for at most one request every three seconds; bursts of up to
+# ARXIV_API_BURST requests are let through so a few categories can still be fetched at once
+ARXIV_API_BURST = int(os.getenv("AXPA_ARXIV_API_BURST", "4"))
+_ARXIV_API_LIMITER = AsyncLimiter(ARXIV_API_BURST, 3.0 * ARXIV_API_BURST)
+
+# Default directory for cached arXiv API responses
+DEFAULT_FEED_CACHE_DIR = "./outputs/http_cache/arxiv"
+
+# Seconds a cached arXiv API response is reused before it is fetched again (0 disables the cache)
+FEED_CACHE_TTL = float(os.getenv("AXPA_FEED_CACHE_TTL", "600"))
 
 
 def _parse_arxiv_datetime(dt_str: str) -> datetime | None:
@@ -19,18 +72,210 @@ def _parse_arxiv_datetime(dt_str: str) -> datetime | None:
         return None
 
 
+def _floor_to_step(dt: datetime, step: timedelta) -> datetime:
+    """Round a timezone-aware datetime down to a whole step since the epoch, in UTC."""
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return epoch + (dt - epoch) // step * step
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create a session for arXiv requests, with pooled keep-alive connections and cached DNS lookups."""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=8, ttl_dns_cache=300),
+        timeout=SESSION_TIMEOUT,
+        # aiohttp already asks for gzip/deflate and decodes them transparently
+        headers={"User-Agent": f"axpa/{__version__}"},
+    )
+
+
+def _iter_feed_entries(content: bytes) -> Iterator[dict]:
+    """
+    Stream the entries of an arXiv Atom feed as plain dicts.
+
+    Each <entry> element is cleared and detached once read, so memory stays
+    flat however many results the feed holds.
+    """
+    for _, entry in etree.iterparse(io.BytesIO(content), tag=f"{ATOM_NS}entry", resolve_entities=False):
+        yield {
+            "id": _ENTRY_ID(entry),
+            "title": _ENTRY_TITLE(entry).strip(),
+            "summary": _ENTRY_SUMMARY(entry).strip(),
+            "published": _ENTRY_PUBLISHED(entry).strip(),
+            "authors": [name.strip() for name in _ENTRY_AUTHORS(entry)],
+            "categories": _ENTRY_CATEGORIES(entry),
+        }
+        # Drop the entry and the already-read siblings before it, so the tree never grows
+        entry.clear()
+        while entry.getprevious() is not None:
+            del entry.getparent()[0]
+
+
+def _get_feed_cache_file(url: str) -> Path:
+    """Get the cache file for an arXiv API query URL."""
+    cache_dir = Path(os.getenv("AXPA_FEED_CACHE_DIR", DEFAULT_FEED_CACHE_DIR))
+    return cache_dir / f"{hashlib.sha1(url.encode()).hexdigest()}.xml"
+
+
+def _load_cached_feed(cache_file: Path) -> tuple[bytes, bool] | None:
+    """
+    Load a cached response body.
+
+    Returns:
+        The body and whether it is younger than FEED_CACHE_TTL, or None if nothing is cached
+    """
+    try:
+        fresh = time.time() - cache_file.stat().st_mtime <= FEED_CACHE_TTL
+        return cache_file.read_bytes(), fresh
+    except OSError:
+        return None
+
+
+def _load_feed_validators(cache_file: Path) -> dict:
+    """Load the ETag/Last-Modified validators saved with a cached response body."""
+    try:
+        validators = json.loads(cache_file.with_suffix(".json").read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return validators if isinstance(validators, dict) else {}
+
+
+def _save_cached_feed(cache_file: Path, body: bytes, headers) -> None:
+    """Save a response body to the cache atomically, along with its validators."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    tmp_file.write_bytes(body)
+    os.replace(tmp_file, cache_file)
+
+    validators = {"etag": headers.get("ETag"), "last_modified": headers.get("Last-Modified")}
+    cache_file.with_suffix(".json").write_text(json.dumps(validators), encoding="utf-8")
+
+
+async def _fetch_feed(session: aiohttp.ClientSession, url: str) -> tuple[int, bytes]:
+    """
+    GET an arXiv API feed, answering repeated queries from a short-lived disk cache.
+
+    Once a cached body is older than FEED_CACHE_TTL it is revalidated with
+    If-None-Match/If-Modified-Since, and kept (with a fresh TTL) on 304 Not Modified.
+
+    Requests (retries included) are paced by _ARXIV_API_LIMITER. 429 and 5xx responses
+    and connection errors are retried with capped exponential backoff (honoring
+    Retry-After); RuntimeError is raised once retries run out.
+
+    Returns:
+        HTTP status and response body (status 200 for cache hits, empty body on errors)
+    """
+    cache_file = _get_feed_cache_file(url)
+    cached = _load_cached_feed(cache_file) if FEED_CACHE_TTL > 0 else None
+    headers = {}
+    if cached is not None:
+        cached_body, fresh = cached
+        if fresh:
+            return 200, cached_body
+
+        validators = _load_feed_validators(cache_file)
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    async def _get() -> tuple[int, bytes, Mapping[str, str]]:
+        await _ARXIV_API_LIMITER.acquire()
+        async with session.get(url, headers=headers, timeout=FEED_REQUEST_TIMEOUT) as response:
+            # Raise on throttling/server errors so the request is retried with backoff
+            if response.status in RETRYABLE_HTTP_STATUSES:
+                response.raise_for_status()
+            if response.status != 200:
+                return response.status, b"", {}
+            return 200, await response.read(), response.headers
+
+    status, body, response_headers = await _retry_async(
+        _get,
+        name=f"GET {url}",
+        retry_on=(aiohttp.ClientError, asyncio.TimeoutError),
+    )
+    if status == 304 and cached is not None:
+        # Unchanged since it was cached; restart its TTL
+        os.utime(cache_file)
+        return 200, cached_body
+    if status != 200:
+        return status, body
+
+    if FEED_CACHE_TTL > 0:
+        _save_cached_feed(cache_file, body, response_headers)
+    return 200, body
+
+
+def _collect_papers_in_range(
+    content: bytes,
+    paper_start_time: datetime,
+    paper_end_time: datetime,
+) -> List[tuple[datetime, Paper]]:
+    """
+    Parse an arXiv feed into the papers published within the (timezone-aware) time range.
+
+    Returns:
+        (published datetime, paper) pairs, in feed order
+    """
+    # String bounds for a cheap pre-check of canonical timestamps before any datetime parsing
+    start_key = paper_start_time.astimezone(timezone.utc).strftime(ARXIV_TIMESTAMP_FORMAT)
+    end_key = paper_end_time.astimezone(timezone.utc).strftime(ARXIV_TIMESTAMP_FORMAT)
+
+    dated_papers = []
+
+    # Process each entry
+    for entry in _iter_feed_entries(content):
+        published = entry["published"]
+
+        # Skip entries clearly outside the time range without parsing their date;
+        # bounds are truncated to the second, so borderline entries fall through
+        if len(published) == 20 and published.endswith("Z") and not start_key <= published <= end_key:
+            continue
+
+        paper_id = entry["id"].rpartition("/abs/")[2]
+
+        # Parse published date
+        published_dt = _parse_arxiv_datetime(published)
+        if published_dt is None:
+            continue
+
+        # Ensure timezone aware
+        if published_dt.tzinfo is None:
+            published_dt = published_dt.replace(tzinfo=timezone.utc)
+
+        # Filter by time range
+        if published_dt < paper_start_time or published_dt > paper_end_time:
+            continue
+
+        # Create Paper model instance
+        paper = Paper(
+            id=paper_id,
+            title=entry["title"],
+            authors=entry["authors"],
+            abstract=entry["summary"],  # arXiv calls it "summary", our model uses "abstract"
+            categories=entry["categories"],
+            published=entry["published"],
+            pdf_link=f"https://arxiv.org/pdf/{paper_id}",
+        )
+
+        dated_papers.append((published_dt, paper))
+
+    return dated_papers
+
+
 async def fetch_papers_from_categories_stage(
     categories: List[str],
     limit: int,
     context,
     paper_start_time: datetime,
     paper_end_time: datetime,
+    semaphore: asyncio.Semaphore | None = None,
+    session: aiohttp.ClientSession | None = None,
 ) -> List[Paper]:
     """
     Stage 2: Fetch papers from specified categories within a time range.
 
     This stage:
-    1. Fetches papers from each category using arXiv API
+    1. Fetches papers from all categories concurrently using arXiv API
     2. Filters papers by the specified time range (paper_start_time to paper_end_time)
     3. Deduplicates papers (papers can appear in multiple categories)
     4. Returns aggregated list of unique papers
@@ -41,35 +286,55 @@ async def fetch_papers_from_categories_stage(
         context: MCP agent context (not used, kept for consistency)
         paper_start_time: Start of time range (inclusive)
         paper_end_time: End of time range (inclusive)
+        semaphore: Optional semaphore bounding concurrent arXiv requests.
+                   If None, all categories are fetched at once.
+        session: Optional aiohttp session to send arXiv requests through.
+                 If None, a session is opened for this call and closed afterwards.
 
     Returns:
         List of Paper models, deduplicated and sorted by published date (newest first)
     """
-    session = aiohttp.ClientSession()
     logger = context.logger
 
-    try:
-        all_papers = []
-        seen_ids = set()
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(len(categories), 1))
+
+    # (published datetime, paper) pairs, so each date is parsed only once
+    dated_papers: List[tuple[datetime, Paper]] = []
+    seen_ids = set()
+
+    # Ensure timezone aware
+    if paper_start_time.tzinfo is None:
+        paper_start_time = paper_start_time.replace(tzinfo=timezone.utc)
+    if paper_end_time.tzinfo is None:
+        paper_end_time = paper_end_time.replace(tzinfo=timezone.utc)
+
+    # Let arXiv drop entries outside the time range; the range is widened to whole
+    # ARXIV_QUERY_RANGE_STEPs (end rounded up) so the URL stays stable between runs,
+    # and the exact bounds are still applied to each entry below
+    date_range = "submittedDate:[{} TO {}]".format(
+        _floor_to_step(paper_start_time, ARXIV_QUERY_RANGE_STEP).strftime(ARXIV_QUERY_DATE_FORMAT),
+        (_floor_to_step(paper_end_time, ARXIV_QUERY_RANGE_STEP) + ARXIV_QUERY_RANGE_STEP).strftime(
+            ARXIV_QUERY_DATE_FORMAT
+        ),
+    )
+
+    logger.info("fetch_papers.start", data={
+        "categories": categories,
+        "limit": limit,
+        "time_range": {
+            "start": paper_start_time.isoformat(),
+            "end": paper_end_time.isoformat()
+        }
+    })
 
-        # Ensure timezone aware
-        if paper_start_time.tzinfo is None:
-            paper_start_time = paper_start_time.replace(tzinfo=timezone.utc)
-        if paper_end_time.tzinfo is None:
-            paper_end_time = paper_end_time.replace(tzinfo=timezone.utc)
-
-        logger.info("fetch_papers.start", data={
-            "categories": categories,
-            "limit": limit,
-            "time_range": {
-                "start": paper_start_time.isoformat(),
-                "end": paper_end_time.isoformat()
-            }
-        })
-
-        limit_per_category = 2000
-
-        for idx, category in enumerate(categories):
+    limit_per_category = 2000
+
+    async def fetch_category(idx: int, category: str) -> List[tuple[datetime, Paper]]:
+        """Fetch the papers of a single category that fall in the time range, with their published datetimes."""
+        category_papers = []
+
+        async with semaphore:
             logger.info("fetch_papers.category", data={
                 "category": category,
                 "index": idx + 1,
@@ -78,65 +343,30 @@ async def fetch_papers_from_categories_stage(
 
             try:
                 # Build arXiv API query for this category
-                # Use cat:category_code to search by category
-                query = f"cat:{category}"
-                url = (
-                    "http://export.arxiv.org/api/query"
-                    f"?search_query={query}"
-                    f"&start=0&max_results={limit_per_category}"
-                    "&sortBy=submittedDate&sortOrder=descending"
-                )
-
-                # Fetch from arXiv API
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        logger.warning("fetch_papers.http_error", data={
-                            "category": category,
-                            "status": response.status
-                        })
-                        continue
-
-                    content = await response.text()
-                    feed = feedparser.parse(content)
-
-                    # Process each entry
-                    for entry in feed.entries:
-                        paper_id = entry.id.split("/abs/")[-1]
-
-                        # Skip if already seen (deduplication)
-                        if paper_id in seen_ids:
-                            continue
-
-                        # Parse published date
-                        published_dt = _parse_arxiv_datetime(entry.published)
-                        if published_dt is None:
-                            continue
-
-                        # Ensure timezone aware
-                        if published_dt.tzinfo is None:
-                            published_dt = published_dt.replace(tzinfo=timezone.utc)
-
-                        # Filter by time range
-                        if published_dt < paper_start_time or published_dt > paper_end_time:
-                            continue
-
-                        # Extract paper metadata
-                        authors = [author.name for author in entry.authors]
-                        entry_categories = [tag.term for tag in entry.tags] if hasattr(entry, "tags") else []
-
-                        # Create Paper model instance
-                        paper = Paper(
-                            id=paper_id,
-                            title=entry.title,
-                            authors=authors,
-                            abstract=entry.summary,  # arXiv calls it "summary", our model uses "abstract"
-                            categories=entry_categories,
-                            published=entry.published,
-                            pdf_link=f"http://arxiv.org/pdf/{paper_id}",
-                        )
+                # Use cat:category_code to search by category, restricted to the time range
+                query = f"cat:{category} AND {date_range}"
+                url = "https://export.arxiv.org/api/query?" + urlencode({
+                    "search_query": query,
+                    "start": 0,
+                    "max_results": limit_per_category,
+                    "sortBy": "submittedDate",
+                    "sortOrder": "descending",
+                })
 
-                        all_papers.append(paper)
-                        seen_ids.add(paper_id)
+                # Fetch from arXiv API (or the feed cache)
+                status, content = await _fetch_feed(session, url)
+                if status != 200:
+                    logger.warning("fetch_papers.http_error", data={
+                        "category": category,
+                        "status": status
+                    })
+                    return category_papers
+
+                # Parse the feed and build papers on a worker thread, so the event loop
+                # keeps serving the other categories' requests meanwhile
+                category_papers = await asyncio.to_thread(
+                    _collect_papers_in_range, content, paper_start_time, paper_end_time
+                )
 
             except Exception as e:
                 # Log error but continue with other categories
@@ -144,27 +374,38 @@ async def fetch_papers_from_categories_stage(
                     "category": category,
                     "error": str(e)
                 })
-                continue
 
-        # Sort by published date (newest first)
-        all_papers.sort(
-            key=lambda p: _parse_arxiv_datetime(p.published) or datetime.min.replace(tzinfo=timezone.utc),
-            reverse=True
+        return category_papers
+
+    # An injected session is left open for the caller to close
+    session_context = contextlib.nullcontext(session) if session is not None else create_session()
+    async with session_context as session:
+        results = await asyncio.gather(
+            *[fetch_category(idx, category) for idx, category in enumerate(categories)]
         )
 
-        result_papers = all_papers[:limit]
+    # Merge in category order, skipping papers already seen (deduplication)
+    for category_papers in results:
+        for published_dt, paper in category_papers:
+            if paper.id in seen_ids:
+                continue
+
+            dated_papers.append((published_dt, paper))
+            seen_ids.add(paper.id)
 
-        logger.info("fetch_papers.complete", data={
-            "total_fetched": len(all_papers),
-            "total_returned": len(result_papers),
-            "duplicates_removed": len(seen_ids) - len(all_papers)
-        })
+    # Select the newest papers; a heap avoids sorting all of them when limit is small
+    newest = heapq.nlargest(limit, dated_papers, key=itemgetter(0))
 
-        # Return up to limit papers
-        return result_papers
+    result_papers = [paper for _, paper in newest]
 
-    finally:
-        await session.close()
+    logger.info("fetch_papers.complete", data={
+        "total_fetched": len(dated_papers),
+        "total_returned": len(result_papers),
+        "duplicates_removed": sum(len(category_papers) for category_papers in results) - len(dated_papers)
+    })
+
+    # Return up to limit papers
+    return result_papers
 
 
 async def fetch_papers_stage_debug(
@@ -173,6 +414,8 @@ async def fetch_papers_stage_debug(
     context,
     paper_start_time: datetime,
     paper_end_time: datetime,
+    semaphore: asyncio.Semaphore | None = None,
+    session: aiohttp.ClientSession | None = None,
 ) -> dict:
     """
     Debug stage: Fetch papers from categories to analyze recent 7-day activity.
@@ -183,6 +426,10 @@ async def fetch_papers_stage_debug(
     Args:
         categories: List of arXiv category codes (e.g., ["cs.SE", "cs.AI"])
         context: MCP agent context (not used, kept for consistency)
+        semaphore: Optional semaphore bounding concurrent arXiv requests.
+                   If None, all categories are fetched at once.
+        session: Optional aiohttp session to send arXiv requests through.
+                 If None, a session is opened for this call and closed afterwards.
 
     Returns:
         Dict with statistics:
@@ -195,35 +442,34 @@ async def fetch_papers_stage_debug(
             "time_range": {"start": "...", "end": "..."}
         }
     """
-    session = aiohttp.ClientSession()
     logger = context.logger
 
-    try:
-        # Calculate last 7 days
-        now = datetime.now(timezone.utc)
-        seven_days_ago = now - timedelta(days=7)
-
-        results = {
-            "total_papers": 0,
-            "categories": {},
-            "time_range": {
-                "start": seven_days_ago.isoformat(),
-                "end": now.isoformat(),
-            }
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(len(categories), 1))
+
+    # Calculate last 7 days
+    now = datetime.now(timezone.utc)
+    seven_days_ago = now - timedelta(days=7)
+
+    results = {
+        "total_papers": 0,
+        "categories": {},
+        "time_range": {
+            "start": seven_days_ago.isoformat(),
+            "end": now.isoformat(),
         }
+    }
 
-        logger.info("fetch_papers_debug.start", data={
-            "categories": categories,
-            "time_range": {"start": seven_days_ago.isoformat(), "end": now.isoformat()}
-        })
+    logger.info("fetch_papers_debug.start", data={
+        "categories": categories,
+        "time_range": {"start": seven_days_ago.isoformat(), "end": now.isoformat()}
+    })
 
-        limit_per_category = 2000
+    limit_per_category = 2000
 
-        for idx, category in enumerate(categories):
-            # Add 3-second delay between requests to avoid rate limiting (except for first request)
-            if idx > 0:
-                logger.info("fetch_papers_debug.rate_limit_delay", data={"seconds": 3})
-                await asyncio.sleep(3)
+    async def fetch_category(idx: int, category: str) -> dict:
+        """Fetch the last 7 days of a single category and return its result entry."""
+        async with semaphore:
             try:
                 logger.info("fetch_papers_debug.category_start", data={
                     "category": category,
@@ -234,118 +480,117 @@ async def fetch_papers_stage_debug(
                 # Build arXiv API query for this category
                 query = f"cat:{category}"
                 url = (
-                    "http://export.arxiv.org/api/query"
+                    "https://export.arxiv.org/api/query"
                     f"?search_query={query}"
                     f"&start=0&max_results={limit_per_category}"
                     "&sortBy=submittedDate&sortOrder=descending"
                 )
 
-                # Fetch from arXiv API
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        logger.warning("fetch_papers_debug.http_error", data={
-                            "category": category,
-                            "status": response.status
-                        })
-                        results["categories"][category] = {
-                            "count": 0,
-                            "papers": [],
-                            "error": f"HTTP {response.status}"
-                        }
+                # Fetch from arXiv API (or the feed cache)
+                status, content = await _fetch_feed(session, url)
+                if status != 200:
+                    logger.warning("fetch_papers_debug.http_error", data={
+                        "category": category,
+                        "status": status
+                    })
+                    return {
+                        "count": 0,
+                        "papers": [],
+                        "error": f"HTTP {status}"
+                    }
+
+                category_papers = []
+                seen_ids = set()
+                total_entries = 0
+
+                # Process each entry (parsed on a worker thread to keep the event loop free)
+                for entry in await asyncio.to_thread(list, _iter_feed_entries(content)):
+                    total_entries += 1
+                    paper_id = entry["id"].rpartition("/abs/")[2]
+
+                    # Skip duplicates
+                    if paper_id in seen_ids:
                         continue
 
-                    content = await response.text()
-                    feed = feedparser.parse(content)
-
-                    category_papers = []
-                    seen_ids = set()
-
-                    # Process each entry
-                    for entry in feed.entries:
-                        paper_id = entry.id.split("/abs/")[-1]
-
-                        # Skip duplicates
-                        if paper_id in seen_ids:
-                            continue
-
-                        # Parse published date
-                        published_dt = _parse_arxiv_datetime(entry.published)
-                        if published_dt is None:
-                            continue
-
-                        # Ensure timezone aware
-                        if published_dt.tzinfo is None:
-                            published_dt = published_dt.replace(tzinfo=timezone.utc)
-
-                        # Filter by last 7 days
-                        if published_dt < seven_days_ago:
-                            continue
-
-                        # Extract paper metadata
-                        authors = [author.name for author in entry.authors]
-                        entry_categories = [tag.term for tag in entry.tags] if hasattr(entry, "tags") else []
-
-                        # Create Paper model instance
-                        paper = Paper(
-                            id=paper_id,
-                            title=entry.title,
-                            authors=authors,
-                            abstract=entry.summary,
-                            categories=entry_categories,
-                            published=entry.published,
-                            pdf_link=f"http://arxiv.org/pdf/{paper_id}",
-                        )
-
-                        category_papers.append(paper)
-                        seen_ids.add(paper_id)
-
-                    # Store results for this category
-                    results["categories"][category] = {
-                        "count": len(category_papers),
-                        "papers": category_papers,
-                    }
+                    # Parse published date
+                    published_dt = _parse_arxiv_datetime(entry["published"])
+                    if published_dt is None:
+                        continue
 
-                    results["total_papers"] += len(category_papers)
+                    # Ensure timezone aware
+                    if published_dt.tzinfo is None:
+                        published_dt = published_dt.replace(tzinfo=timezone.utc)
 
-                    # Log statistics
-                    stats_data = {
-                        "category": category,
-                        "papers_found": len(category_papers),
-                        "total_entries_fetched": len(feed.entries)
-                    }
+                    # Filter by last 7 days
+                    if published_dt < seven_days_ago:
+                        continue
+
+                    # Create Paper model instance
+                    paper = Paper(
+                        id=paper_id,
+                        title=entry["title"],
+                        authors=entry["authors"],
+                        abstract=entry["summary"],
+                        categories=entry["categories"],
+                        published=entry["published"],
+                        pdf_link=f"https://arxiv.org/pdf/{paper_id}",
+                    )
+
+                    category_papers.append(paper)
+                    seen_ids.add(paper_id)
+
+                # Log statistics
+                stats_data = {
+                    "category": category,
+                    "papers_found": len(category_papers),
+                    "total_entries_fetched": total_entries
+                }
 
-                    if category_papers:
-                        newest = _parse_arxiv_datetime(category_papers[0].published)
-                        oldest = _parse_arxiv_datetime(category_papers[-1].published)
-                        stats_data["newest_paper"] = newest.isoformat() if newest else None
-                        stats_data["oldest_paper"] = oldest.isoformat() if oldest else None
+                if category_papers:
+                    newest = _parse_arxiv_datetime(category_papers[0].published)
+                    oldest = _parse_arxiv_datetime(category_papers[-1].published)
+                    stats_data["newest_paper"] = newest.isoformat() if newest else None
+                    stats_data["oldest_paper"] = oldest.isoformat() if oldest else None
 
-                    logger.info("fetch_papers_debug.category_complete", data=stats_data)
+                logger.info("fetch_papers_debug.category_complete", data=stats_data)
+
+                return {
+                    "count": len(category_papers),
+                    "papers": category_papers,
+                }
 
             except Exception as e:
                 logger.error("fetch_papers_debug.category_error", data={
                     "category": category,
                     "error": str(e)
                 })
-                results["categories"][category] = {
+                return {
                     "count": 0,
                     "papers": [],
                     "error": str(e)
                 }
-                continue
 
-        # Log summary
-        category_breakdown = {cat: data["count"] for cat, data in results["categories"].items()}
-        logger.info("fetch_papers_debug.complete", data={
-            "time_range": {
-                "start": seven_days_ago.strftime('%Y-%m-%d'),
-                "end": now.strftime('%Y-%m-%d')
-            },
-            "total_papers": results["total_papers"],
-            "breakdown": category_breakdown
-        })
-
-        return results
+    # An injected session is left open for the caller to close
+    session_context = contextlib.nullcontext(session) if session is not None else create_session()
+    async with session_context as session:
+        category_results = await asyncio.gather(
+            *[fetch_category(idx, category) for idx, category in enumerate(categories)]
+        )
 
-    finally:
-        await session.close()
\ No newline at end of file
+    # Store results in category order
+    for category, category_result in zip(categories, category_results):
+        results["categories"][category] = category_result
+        results["total_papers"] += category_result["count"]
+
+    # Log summary
+    category_breakdown = {cat: data["count"] for cat, data in results["categories"].items()}
+    logger.info("fetch_papers_debug.complete", data={
+        "time_range": {
+            "start": seven_days_ago.strftime('%Y-%m-%d'),
+            "end": now.strftime('%Y-%m-%d')
+        },
+        "total_papers": results["total_papers"],
+        "breakdown": category_breakdown
+    })
+
+    return results
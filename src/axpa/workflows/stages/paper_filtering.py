@@ -1,9 +1,17 @@
 from axpa.agents.paper_filter import create_paper_filter_agent
-from axpa.outputs.data_models import Paper, FilterResult
+from axpa.utils import LLM_RATE_LIMITER
+from axpa.outputs.data_models import Paper, FilterResult, BatchFilterResult
 from mcp_agent.workflows.llm.augmented_llm import RequestParams
 
 from typing import List
 import asyncio
+import os
+
+# Papers judged per LLM request
+FILTER_BATCH_SIZE = int(os.getenv("AXPA_FILTER_BATCH_SIZE", "10"))
+
+# Paper fields left out of filter prompts (not needed to judge the paper)
+PROMPT_EXCLUDED_FIELDS = {"pdf_link", "markdown_path"}
 
 
 async def filter_papers_stage(
@@ -11,16 +19,31 @@ async def filter_papers_stage(
     query: str,
     context,
     llm_factory,
+    semaphore: asyncio.Semaphore | None = None,
 ) -> List[Paper]:
     """
     Stage 3: Filter papers in parallel using asyncio.gather.
 
-    Creates one filter agent instance and calls it for each paper in parallel.
-    Returns only accepted papers.
+    Creates one filter agent instance and calls it for each batch of
+    FILTER_BATCH_SIZE papers in parallel. Papers a batch response leaves out
+    are filtered one by one. Returns only accepted papers.
+
+    Args:
+        semaphore: Optional semaphore bounding concurrent LLM calls.
+                   If None, every call is issued at once.
     """
     logger = context.logger
     logger.info("filter_papers.start", data={"total_papers": len(papers), "query": query})
 
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(len(papers), 1))
+
+    # Serialize each paper once, compactly, for use in both batched and single prompts
+    paper_prompts = {
+        paper.id: paper.model_dump_json(exclude=PROMPT_EXCLUDED_FIELDS)
+        for paper in papers
+    }
+
     # Create a single filter agent
     filter_agent = create_paper_filter_agent()
 
@@ -28,24 +51,27 @@ async def filter_papers_stage(
     async with filter_agent as agent_ctx:
         llm = await agent_ctx.attach_llm(llm_factory)
 
-        # Request parameters for filtering
+        # Request parameters for filtering; every prompt is self-contained,
+        # so calls skip the shared history and can run concurrently
         request_params = RequestParams(
             maxTokens=16384,
-            temperature=0.3
+            temperature=0.3,
+            use_history=False,
         )
 
         # Create filtering tasks for each paper
         async def filter_single_paper(paper: Paper) -> tuple[Paper, FilterResult | None]:
             """Filter a single paper and return (paper, result)."""
             try:
-                message = f"Query: {query}\n\nPaper:\n{paper.model_dump_json(indent=2)}"
+                message = f"Query: {query}\n\nPaper:\n{paper_prompts[paper.id]}"
 
                 # Use structured generation - much cleaner!
-                filter_result = await llm.generate_structured(
-                    message=message,
-                    response_model=FilterResult,
-                    request_params=request_params
-                )
+                async with semaphore, LLM_RATE_LIMITER:
+                    filter_result = await llm.generate_structured(
+                        message=message,
+                        response_model=FilterResult,
+                        request_params=request_params
+                    )
 
                 # Add paper_id to the result
                 filter_result.paper_id = paper.id
@@ -59,19 +85,72 @@ async def filter_papers_stage(
                 })
                 return (paper, None)
 
-        # Run all filtering tasks in parallel
-        logger.info("filter_papers.parallel_start", data={"count": len(papers)})
+        async def filter_batch(batch: List[Paper]) -> List[tuple[Paper, FilterResult | None]]:
+            """Filter a batch of papers in one call, falling back to single calls for papers left out."""
+            filter_results: dict[str, FilterResult] = {}
+            try:
+                papers_text = "\n".join(
+                    f"[{idx + 1}] {paper_prompts[paper.id]}" for idx, paper in enumerate(batch)
+                )
+                message = (
+                    f"Query: {query}\n\n"
+                    f"Papers ({len(batch)}):\n{papers_text}\n\n"
+                    "Return one result per paper in `results`, with `paper_id` set to the paper's id."
+                )
+
+                async with semaphore, LLM_RATE_LIMITER:
+                    batch_result = await llm.generate_structured(
+                        message=message,
+                        response_model=BatchFilterResult,
+                        request_params=request_params
+                    )
+
+                batch_ids = {paper.id for paper in batch}
+                filter_results = {
+                    result.paper_id: result
+                    for result in batch_result.results
+                    if result.paper_id in batch_ids
+                }
+            except Exception as e:
+                logger.warning("filter_papers.batch_error", data={
+                    "paper_ids": [paper.id for paper in batch],
+                    "error": str(e)
+                })
+
+            missing = [paper for paper in batch if paper.id not in filter_results]
+            if missing:
+                logger.warning("filter_papers.batch_fallback", data={
+                    "paper_ids": [paper.id for paper in missing]
+                })
+                for paper, filter_result in await asyncio.gather(*[filter_single_paper(paper) for paper in missing]):
+                    if filter_result is not None:
+                        filter_results[paper.id] = filter_result
+
+            return [(paper, filter_results.get(paper.id)) for paper in batch]
+
+        batches = [papers[i:i + FILTER_BATCH_SIZE] for i in range(0, len(papers), FILTER_BATCH_SIZE)]
+
+        # Run all filtering batches in parallel
+        logger.info("filter_papers.parallel_start", data={"count": len(papers), "batches": len(batches)})
 
         try:
-            results = await asyncio.gather(
-                *[filter_single_paper(paper) for paper in papers],
+            batch_results = await asyncio.gather(
+                *[filter_batch(batch) for batch in batches],
                 return_exceptions=True
             )
-            logger.info("filter_papers.parallel_complete", data={"results_count": len(results)})
+            logger.info("filter_papers.parallel_complete", data={"results_count": len(batch_results)})
         except Exception as e:
             logger.error("filter_papers.parallel_error", data={"error": str(e)})
             raise
 
+        # One entry per paper; a batch that raised counts against each of its papers
+        results = []
+        for batch, batch_result in zip(batches, batch_results):
+            if isinstance(batch_result, Exception):
+                results.extend([batch_result] * len(batch))
+            else:
+                results.extend(batch_result)
+
         # Aggregate results
         accepted_papers = []
         rejected_papers = []
@@ -1,22 +1,93 @@
 import traceback
-from pathlib import Path
 from axpa.agents.paper_scorer import create_paper_scorer_agent
-from axpa.outputs.data_models import Paper, ScoreResult, AggregatedScoreResult
+from axpa.outputs.data_models import Paper, ScoreResult, BatchScoreResult, AggregatedScoreResult
+from axpa.utils import (
+    LLM_RATE_LIMITER,
+    compact_for_llm,
+    llm_cache_key,
+    llm_model_id,
+    load_cached_llm_result,
+    load_markdown_content,
+    save_cached_llm_result,
+)
+from axpa.workflows.stages.retry import LLM_RETRIES, TRANSIENT_LLM_ERRORS, EmptyLLMResponseError, _retry_async
 from mcp_agent.workflows.llm.augmented_llm import RequestParams
 
+from collections import defaultdict
+from contextlib import AsyncExitStack
+from itertools import chain
 from typing import List
 import asyncio
-
-
-def load_markdown_content(markdown_path: str) -> str | None:
-    """Load markdown content from file path."""
-    try:
-        path = Path(markdown_path)
-        if path.exists():
-            return path.read_text(encoding="utf-8")
-        return None
-    except Exception:
-        return None
+import os
+
+
+# Bump whenever the format prompt or response handling changes, so cached scores are not reused
+# (the model and scorer instructions are part of every cache key already)
+SCORING_PROMPT_VERSION = 3
+
+# Evaluations formatted as ScoreResults per LLM request
+SCORE_FORMAT_BATCH_SIZE = int(os.getenv("AXPA_SCORE_FORMAT_BATCH_SIZE", "10"))
+
+SCORE_FORMAT_RULES = (
+    "Return ONLY valid JSON. All score fields (relevance, novelty, soundness, clarity, significance, "
+    "overall_score) must be numbers between 0-10. All text fields (summary, strengths, weaknesses, "
+    "recommendation) must be non-empty strings."
+)
+
+# ScoreResult dimensions averaged across rounds
+SCORE_DIMENSIONS = ("relevance", "novelty", "soundness", "clarity", "significance")
+
+# Prompt templates, filled in with str.format
+MARKDOWN_SCORING_TEMPLATE = (
+    "Review the following paper for the research query: {query}\n"
+    "\n"
+    "Paper metadata:\n"
+    "- Paper ID: {paper.id}\n"
+    "- Title: {paper.title}\n"
+    "- Authors: {authors}\n"
+    "- Categories: {categories}\n"
+    "- Published: {paper.published}\n"
+    "\n"
+    "## Paper Content (Markdown)\n"
+    "\n"
+    "{markdown_content}\n"
+    "\n"
+    "---\n"
+    "\n"
+    "Task: Evaluate this paper according to your scoring criteria. "
+    "Provide a complete evaluation with all scores and assessments."
+)
+
+DOWNLOAD_SCORING_TEMPLATE = (
+    "Review paper ID: {paper.id} for the research query: {query}\n"
+    "\n"
+    "Paper metadata:\n"
+    "- Title: {paper.title}\n"
+    "- Authors: {authors}\n"
+    "- Categories: {categories}\n"
+    "- Published: {paper.published}\n"
+    "\n"
+    "Task: Use the arxiv MCP server tools to download and read the paper content, "
+    "then evaluate it according to your scoring criteria. "
+    "Provide a complete evaluation with all scores and assessments."
+)
+
+SCORE_FORMAT_TEMPLATE = (
+    "Based on the following paper evaluation, provide a response in JSON format matching the ScoreResult schema.\n"
+    "\n"
+    "Evaluation:\n"
+    "{evaluation}\n"
+    "\n"
+) + SCORE_FORMAT_RULES
+
+BATCH_SCORE_FORMAT_TEMPLATE = (
+    "Based on the following {count} paper evaluations, provide a response in JSON format "
+    "with one ScoreResult per paper in `results`, with `paper_id` set to the paper's ID.\n"
+    "\n"
+    "Evaluations:\n"
+    "{evaluations}\n"
+    "\n"
+) + SCORE_FORMAT_RULES
 
 
 async def score_papers_stage(
@@ -24,23 +95,42 @@ async def score_papers_stage(
     query: str,
     context,
     llm_factory,
+    semaphore: asyncio.Semaphore | None = None,
+    early_exit_low: float | None = None,
+    early_exit_high: float | None = None,
 ) -> List[AggregatedScoreResult]:
     """
     Stage 5: Score papers in two independent rounds.
 
     This implements a double-blind review process:
     - Round 1: First independent scoring of all papers
-    - Round 2: Second independent scoring of all papers (no knowledge of Round 1)
+    - Round 2: Second independent scoring of all papers (no knowledge of Round 1),
+      run concurrently with Round 1
     - Aggregation: Average scores from both rounds
     - overall_recommendation: "Accept" if accept_rate >= 0.5, else "Reject"
 
     Implementation pattern:
     - Papers are grouped by whether they have pre-downloaded markdown content
-    - Papers with markdown: content is provided directly in the message
+    - Papers with markdown: content is provided directly in the message, and a single
+      generate_structured() call returns the ScoreResult (native structured output)
     - Papers without markdown: agent uses tools to download and read the paper
-    - Two-step approach per paper:
-      1. generate_str() - agent evaluates paper and creates evaluation text
-      2. generate_structured() - format text as ScoreResult JSON
+    - Two-step approach for papers without markdown:
+      1. generate_str() - agent evaluates each paper and creates evaluation text
+      2. generate_structured() - format the evaluations as ScoreResult JSON,
+         SCORE_FORMAT_BATCH_SIZE papers per call (papers a batch leaves out
+         are formatted one by one)
+    - Transient LLM errors (timeouts, throttling, 5xx, empty responses) are retried
+      up to LLM_RETRIES attempts before a paper is dropped from the round
+
+    Args:
+        semaphore: Optional semaphore bounding concurrent LLM calls.
+                   If None, all papers of both rounds are scored at once.
+        early_exit_low: Optional Round 1 overall_score at or below which a paper is
+                        decisively rejected and not scored in Round 2.
+        early_exit_high: Optional Round 1 overall_score at or above which a paper is
+                         decisively accepted and not scored in Round 2.
+                         If either is set, Round 2 runs after Round 1 instead of concurrently,
+                         and decisive papers are aggregated from their Round 1 score alone.
 
     Returns:
         List of AggregatedScoreResult objects with paper, scores, and acceptance decision
@@ -51,89 +141,87 @@ async def score_papers_stage(
         "query": query
     })
 
-    # Separate papers by markdown availability
-    papers_with_markdown = [(p, load_markdown_content(p.markdown_path))
-                            for p in papers if p.markdown_path]
-    papers_with_markdown = [(p, content) for p, content in papers_with_markdown if content]
-    papers_without_markdown = [p for p in papers if not p.markdown_path or
-                               p not in [pw[0] for pw in papers_with_markdown]]
+    # Separate papers by markdown availability, reading the files off the event loop
+    papers_with_paths = [p for p in papers if p.markdown_path]
+    contents = await asyncio.gather(
+        *[asyncio.to_thread(load_markdown_content, p.markdown_path) for p in papers_with_paths]
+    )
+    papers_with_markdown = [(p, content) for p, content in zip(papers_with_paths, contents) if content]
+    markdown_ids = {p.id for p, _ in papers_with_markdown}
+    papers_without_markdown = [p for p in papers if p.id not in markdown_ids]
 
     logger.info("score_papers.paper_groups", data={
         "with_markdown": len(papers_with_markdown),
         "without_markdown": len(papers_without_markdown)
     })
 
-    # Request parameters for scoring
+    if semaphore is None:
+        # Room for every paper of both rounds
+        semaphore = asyncio.Semaphore(max(2 * len(papers), 1))
+
+    # Request parameters for scoring; every prompt is self-contained (tool calls within
+    # one evaluation still see each other), so both rounds can share an agent's LLM
     request_params = RequestParams(
         maxTokens=8192,
         temperature=0.4,
-        max_iterations=50
+        max_iterations=50,
+        use_history=False
     )
 
-    async def score_paper_with_markdown(
-        paper: Paper,
-        markdown_content: str,
-        round_num: int,
-        llm
-    ) -> tuple[Paper, ScoreResult | None]:
-        """Score a paper that has pre-downloaded markdown content."""
-        try:
-            message = f"""Review the following paper for the research query: {query}
-
-Paper metadata:
-- Paper ID: {paper.id}
-- Title: {paper.title}
-- Authors: {', '.join(paper.authors)}
-- Categories: {', '.join(paper.categories)}
-- Published: {paper.published}
-
-## Paper Content (Markdown)
-
-{markdown_content}
-
----
-
-Task: Evaluate this paper according to your scoring criteria. If there are unclear mathematical formulas, you can use the arxiv-latex-mcp tool to get the LaTeX source. Provide a complete evaluation with all scores and assessments."""
-
-            # Step 1: Get the text evaluation
-            text_response = await llm.generate_str(
-                message=message,
-                request_params=request_params
-            )
-
-            logger.debug(f"score_papers.round{round_num}_text_response", data={
-                "paper_id": paper.id,
-                "response_length": len(text_response),
-                "has_markdown": True
-            })
+    # Request parameters for scoring straight into a ScoreResult; every prompt is self-contained
+    structured_request_params = RequestParams(
+        maxTokens=8192,
+        temperature=0.4,
+        use_history=False
+    )
 
-            # Step 2: Format the text evaluation as structured ScoreResult
-            format_prompt = f"""Based on the following paper evaluation, provide a response in JSON format matching the ScoreResult schema.
+    # Request parameters for formatting evaluations; every format prompt is self-contained
+    format_request_params = RequestParams(
+        maxTokens=16384,
+        temperature=0.1,
+        use_history=False
+    )
 
-Evaluation:
-{text_response}
+    async def call_llm(name: str, fn):
+        """Run an LLM call under the semaphore and rate limiter, retrying transient provider errors."""
+        async def attempt():
+            async with semaphore, LLM_RATE_LIMITER:
+                return await fn()
+
+        return await _retry_async(attempt, name=name, retries=LLM_RETRIES, retry_on=TRANSIENT_LLM_ERRORS)
+
+    def markdown_scoring_message(paper: Paper, markdown_content: str) -> str:
+        """Scoring prompt for a paper that has pre-downloaded markdown content."""
+        return MARKDOWN_SCORING_TEMPLATE.format(
+            query=query,
+            paper=paper,
+            authors=", ".join(paper.authors),
+            categories=", ".join(paper.categories),
+            markdown_content=compact_for_llm(markdown_content),
+        )
 
-Return ONLY valid JSON. All score fields (relevance, novelty, soundness, clarity, significance, overall_score) must be numbers between 0-10. All text fields (summary, strengths, weaknesses, recommendation) must be non-empty strings."""
+    def download_scoring_message(paper: Paper) -> str:
+        """Scoring prompt for a paper that needs to be downloaded by the agent."""
+        return DOWNLOAD_SCORING_TEMPLATE.format(
+            query=query,
+            paper=paper,
+            authors=", ".join(paper.authors),
+            categories=", ".join(paper.categories),
+        )
 
-            score_result = await llm.generate_structured(
-                message=format_prompt,
+    async def score_paper_structured(
+        paper: Paper,
+        message: str,
+        round_num: int,
+        llm
+    ) -> ScoreResult | None:
+        """Score a paper in a single call that emits the ScoreResult directly (native structured output)."""
+        try:
+            return await call_llm(f"score_paper({paper.id})", lambda: llm.generate_structured(
+                message=f"{message}\n\n{SCORE_FORMAT_RULES}",
                 response_model=ScoreResult,
-                request_params=RequestParams(
-                    maxTokens=16384,
-                    temperature=0.1,
-                    use_history=False
-                )
-            )
-
-            score_result.paper_id = paper.id
-
-            logger.debug(f"score_papers.round{round_num}_scored", data={
-                "paper_id": paper.id,
-                "overall_score": score_result.overall_score,
-                "has_markdown": True
-            })
-
-            return (paper, score_result)
+                request_params=structured_request_params
+            ))
 
         except Exception as e:
             logger.error(f"score_papers.round{round_num}_error", data={
@@ -142,153 +230,266 @@ Return ONLY valid JSON. All score fields (relevance, novelty, soundness, clarity
                 "traceback": traceback.format_exc(),
                 "has_markdown": True
             })
-            return (paper, None)
+            return None
 
-    async def score_paper_without_markdown(
+    async def evaluate_paper(
         paper: Paper,
+        message: str,
         round_num: int,
-        llm
-    ) -> tuple[Paper, ScoreResult | None]:
-        """Score a paper that needs to be downloaded by the agent."""
+        llm,
+        has_markdown: bool
+    ) -> str | None:
+        """Step 1: get the text evaluation of a paper."""
         try:
-            message = f"""Review paper ID: {paper.id} for the research query: {query}
-
-Paper metadata:
-- Title: {paper.title}
-- Authors: {', '.join(paper.authors)}
-- Categories: {', '.join(paper.categories)}
-- Published: {paper.published}
-
-Task: Use the arxiv MCP server tools to download and read the paper content, then evaluate it according to your scoring criteria. Provide a complete evaluation with all scores and assessments."""
+            async def generate_evaluation() -> str:
+                text_response = await llm.generate_str(
+                    message=message,
+                    request_params=request_params
+                )
+                if not text_response.strip():
+                    raise EmptyLLMResponseError(f"empty evaluation for paper {paper.id}")
+                return text_response
 
-            # Step 1: Get the text evaluation
-            text_response = await llm.generate_str(
-                message=message,
-                request_params=request_params
-            )
+            text_response = await call_llm(f"evaluate_paper({paper.id})", generate_evaluation)
 
             logger.debug(f"score_papers.round{round_num}_text_response", data={
                 "paper_id": paper.id,
                 "response_length": len(text_response),
-                "has_markdown": False
+                "has_markdown": has_markdown
             })
 
-            # Step 2: Format the text evaluation as structured ScoreResult
-            format_prompt = f"""Based on the following paper evaluation, provide a response in JSON format matching the ScoreResult schema.
-
-Evaluation:
-{text_response}
-
-Return ONLY valid JSON. All score fields (relevance, novelty, soundness, clarity, significance, overall_score) must be numbers between 0-10. All text fields (summary, strengths, weaknesses, recommendation) must be non-empty strings."""
+            return text_response
 
-            score_result = await llm.generate_structured(
-                message=format_prompt,
-                response_model=ScoreResult,
-                request_params=RequestParams(
-                    maxTokens=16384,
-                    temperature=0.1,
-                    use_history=False
-                )
-            )
-
-            score_result.paper_id = paper.id
-
-            logger.debug(f"score_papers.round{round_num}_scored", data={
+        except Exception as e:
+            logger.error(f"score_papers.round{round_num}_error", data={
                 "paper_id": paper.id,
-                "overall_score": score_result.overall_score,
-                "has_markdown": False
+                "error": str(e),
+                "traceback": traceback.format_exc(),
+                "has_markdown": has_markdown
             })
+            return None
 
-            return (paper, score_result)
+    async def format_single_evaluation(
+        paper: Paper,
+        text_response: str,
+        round_num: int,
+        llm,
+        has_markdown: bool
+    ) -> ScoreResult | None:
+        """Step 2 for one paper: format its text evaluation as a structured ScoreResult."""
+        try:
+            return await call_llm(f"format_evaluation({paper.id})", lambda: llm.generate_structured(
+                message=SCORE_FORMAT_TEMPLATE.format(evaluation=text_response),
+                response_model=ScoreResult,
+                request_params=format_request_params
+            ))
 
         except Exception as e:
             logger.error(f"score_papers.round{round_num}_error", data={
                 "paper_id": paper.id,
                 "error": str(e),
                 "traceback": traceback.format_exc(),
-                "has_markdown": False
+                "has_markdown": has_markdown
             })
-            return (paper, None)
+            return None
 
-    async def run_scoring_round(round_num: int) -> List[tuple[Paper, ScoreResult | None]]:
-        """Run a single round of scoring for all papers."""
-        logger.info(f"score_papers.round{round_num}_start", data={"round": round_num})
+    async def format_evaluations(
+        evaluations: List[tuple[Paper, str]],
+        round_num: int,
+        llm,
+        has_markdown: bool
+    ) -> List[tuple[Paper, ScoreResult | None]]:
+        """Step 2: format a batch of text evaluations in one call, falling back to single calls for papers left out."""
+        score_results: dict[str, ScoreResult] = {}
+        if len(evaluations) > 1:
+            try:
+                evaluations_text = "\n\n".join(
+                    f"### Paper ID: {paper.id}\n\n{text_response}" for paper, text_response in evaluations
+                )
+                format_prompt = BATCH_SCORE_FORMAT_TEMPLATE.format(
+                    count=len(evaluations),
+                    evaluations=evaluations_text,
+                )
 
-        all_results = []
+                batch_result = await call_llm("format_evaluations", lambda: llm.generate_structured(
+                    message=format_prompt,
+                    response_model=BatchScoreResult,
+                    request_params=format_request_params
+                ))
+
+                batch_ids = {paper.id for paper, _ in evaluations}
+                score_results = {
+                    result.paper_id: result
+                    for result in batch_result.results
+                    if result.paper_id in batch_ids
+                }
+            except Exception as e:
+                logger.warning(f"score_papers.round{round_num}_format_batch_error", data={
+                    "paper_ids": [paper.id for paper, _ in evaluations],
+                    "error": str(e),
+                    "has_markdown": has_markdown
+                })
+
+        missing = [(paper, text_response) for paper, text_response in evaluations
+                   if paper.id not in score_results]
+        if missing:
+            if len(evaluations) > 1:
+                logger.warning(f"score_papers.round{round_num}_format_batch_fallback", data={
+                    "paper_ids": [paper.id for paper, _ in missing]
+                })
+            single_results = await asyncio.gather(
+                *[format_single_evaluation(paper, text_response, round_num, llm, has_markdown)
+                  for paper, text_response in missing]
+            )
+            for (paper, _), score_result in zip(missing, single_results):
+                if score_result is not None:
+                    score_results[paper.id] = score_result
 
-        # Score papers with markdown (using simplified agent)
-        if papers_with_markdown:
-            logger.info(f"score_papers.round{round_num}_markdown_start", data={
-                "count": len(papers_with_markdown)
-            })
+        return [(paper, score_results.get(paper.id)) for paper, _ in evaluations]
+
+    def lookup_cached_scores(
+        round_num: int,
+        messages: List[tuple[Paper, str]],
+        has_markdown: bool
+    ) -> tuple[List[tuple[Paper, ScoreResult]], List[tuple[Paper, str, str]]]:
+        """
+        Split a group into papers already scored from this exact prompt and
+        (paper, message, cache_key) triples still pending.
+        """
+        cached_results = []
+        pending = []
+        for paper, message in messages:
+            cache_key = llm_cache_key(
+                "score", round_num, SCORING_PROMPT_VERSION, model_id, scorer_agents[has_markdown].instruction, message
+            )
+            cached = load_cached_llm_result(cache_key)
+            if cached is None:
+                pending.append((paper, message, cache_key))
+            else:
+                logger.debug(f"score_papers.round{round_num}_cache_hit", data={
+                    "paper_id": paper.id,
+                    "has_markdown": has_markdown
+                })
+                cached_results.append((paper, ScoreResult.model_validate(cached)))
+        return cached_results, pending
+
+    # Cached scores are only reused for the same model and agent instruction
+    model_id = llm_model_id(llm_factory, context)
+    scorer_agents = {
+        has_markdown: create_paper_scorer_agent(has_markdown=has_markdown) for has_markdown in (True, False)
+    }
+
+    # Both rounds send the same prompt for a paper, so build each one once. The identical
+    # prompts also let providers with prompt caching reuse the processed input across rounds
+    markdown_messages = [(paper, markdown_scoring_message(paper, content))
+                         for paper, content in papers_with_markdown]
+    download_messages = [(paper, download_scoring_message(paper)) for paper in papers_without_markdown]
+
+    # Serve what both rounds can from the cache first, so a group's agent is only
+    # started when some of its papers still need scoring
+    groups = {}
+    for round_num in (1, 2):
+        for has_markdown, messages in ((True, markdown_messages), (False, download_messages)):
+            if messages:
+                groups[round_num, has_markdown] = lookup_cached_scores(round_num, messages, has_markdown)
+
+    async def score_group(
+        round_num: int,
+        has_markdown: bool,
+        llm
+    ) -> List[tuple[Paper, ScoreResult | None]]:
+        """Score one group of papers (with or without markdown) for a round."""
+        group = "markdown" if has_markdown else "download"
+        cached_results, pending = groups[round_num, has_markdown]
+        logger.info(f"score_papers.round{round_num}_{group}_start", data={
+            "count": len(cached_results) + len(pending)
+        })
 
-            scorer_agent_markdown = create_paper_scorer_agent(round_num=round_num, has_markdown=True)
+        group_results = list(cached_results)
 
-            async with scorer_agent_markdown as agent_ctx:
-                llm = await agent_ctx.attach_llm(llm_factory)
-                llm.history.clear()
+        if pending:
+            try:
+                cache_keys = {paper.id: cache_key for paper, _, cache_key in pending}
 
-                try:
-                    results = await asyncio.gather(
-                        *[score_paper_with_markdown(paper, content, round_num, llm)
-                          for paper, content in papers_with_markdown],
+                if has_markdown:
+                    # The paper content is in the prompt, so no tools are needed and the
+                    # ScoreResult is generated directly in one structured-output call
+                    outcomes = await asyncio.gather(
+                        *[score_paper_structured(paper, message, round_num, llm)
+                          for paper, message, _ in pending],
+                        return_exceptions=True
+                    )
+                    scored = []
+                    for idx, ((paper, _, _), outcome) in enumerate(zip(pending, outcomes)):
+                        if isinstance(outcome, Exception):
+                            logger.warning(f"score_papers.round{round_num}_{group}_exception", data={
+                                "index": idx,
+                                "error": str(outcome)
+                            })
+                        else:
+                            scored.append((paper, outcome))
+                else:
+                    text_responses = await asyncio.gather(
+                        *[evaluate_paper(paper, message, round_num, llm, has_markdown)
+                          for paper, message, _ in pending],
                         return_exceptions=True
                     )
 
-                    for idx, result in enumerate(results):
-                        if isinstance(result, Exception):
-                            logger.warning(f"score_papers.round{round_num}_markdown_exception", data={
+                    evaluations = []
+                    scored = []
+                    for idx, ((paper, _, _), text_response) in enumerate(zip(pending, text_responses)):
+                        if isinstance(text_response, Exception):
+                            logger.warning(f"score_papers.round{round_num}_{group}_exception", data={
                                 "index": idx,
-                                "error": str(result)
+                                "error": str(text_response)
                             })
+                        elif text_response is None:
+                            scored.append((paper, None))
                         else:
-                            all_results.append(result)
+                            evaluations.append((paper, text_response))
 
-                except Exception as e:
-                    logger.error(f"score_papers.round{round_num}_markdown_error", data={
-                        "error": str(e)
-                    })
+                    batches = [evaluations[i:i + SCORE_FORMAT_BATCH_SIZE]
+                               for i in range(0, len(evaluations), SCORE_FORMAT_BATCH_SIZE)]
+                    batch_results = await asyncio.gather(
+                        *[format_evaluations(batch, round_num, llm, has_markdown) for batch in batches]
+                    )
+                    scored.extend(result for batch in batch_results for result in batch)
 
-            logger.info(f"score_papers.round{round_num}_markdown_complete", data={
-                "scored": len([r for r in all_results if r[1] is not None])
-            })
+                for paper, score_result in scored:
+                    if score_result is not None:
+                        score_result.paper_id = paper.id
+                        save_cached_llm_result(cache_keys[paper.id], score_result.model_dump())
 
-        # Score papers without markdown (using full agent with tools)
-        if papers_without_markdown:
-            logger.info(f"score_papers.round{round_num}_download_start", data={
-                "count": len(papers_without_markdown)
-            })
+                        logger.debug(f"score_papers.round{round_num}_scored", data={
+                            "paper_id": paper.id,
+                            "overall_score": score_result.overall_score,
+                            "has_markdown": has_markdown
+                        })
 
-            scorer_agent_download = create_paper_scorer_agent(round_num=round_num, has_markdown=False)
+                    group_results.append((paper, score_result))
 
-            async with scorer_agent_download as agent_ctx:
-                llm = await agent_ctx.attach_llm(llm_factory)
-                llm.history.clear()
+            except Exception as e:
+                logger.error(f"score_papers.round{round_num}_{group}_error", data={
+                    "error": str(e)
+                })
 
-                try:
-                    results = await asyncio.gather(
-                        *[score_paper_without_markdown(paper, round_num, llm)
-                          for paper in papers_without_markdown],
-                        return_exceptions=True
-                    )
+        logger.info(f"score_papers.round{round_num}_{group}_complete", data={
+            "scored": len([r for r in group_results if r[1] is not None])
+        })
 
-                    for idx, result in enumerate(results):
-                        if isinstance(result, Exception):
-                            logger.warning(f"score_papers.round{round_num}_download_exception", data={
-                                "index": idx,
-                                "error": str(result)
-                            })
-                        else:
-                            all_results.append(result)
+        return group_results
 
-                except Exception as e:
-                    logger.error(f"score_papers.round{round_num}_download_error", data={
-                        "error": str(e)
-                    })
+    async def run_scoring_round(round_num: int, scorer_llms: dict) -> List[tuple[Paper, ScoreResult | None]]:
+        """Run a single round of scoring for all papers."""
+        logger.info(f"score_papers.round{round_num}_start", data={"round": round_num})
 
-            logger.info(f"score_papers.round{round_num}_download_complete", data={
-                "scored": len([r for r in all_results if r[1] is not None])
-            })
+        all_results = []
+
+        # Score papers with markdown (using simplified agent), then papers without
+        # markdown (using full agent with tools)
+        for has_markdown in (True, False):
+            if (round_num, has_markdown) in groups:
+                all_results.extend(await score_group(round_num, has_markdown, scorer_llms.get(has_markdown)))
 
         # Filter out failed results
         round_results = [(paper, score) for paper, score in all_results if score is not None]
@@ -300,48 +501,78 @@ Return ONLY valid JSON. All score fields (relevance, novelty, soundness, clarity
 
         return round_results
 
-    # Run both rounds sequentially
-    logger.info("score_papers.running_rounds", data={"total_rounds": 2})
-
-    round1_results = await run_scoring_round(round_num=1)
-    round2_results = await run_scoring_round(round_num=2)
+    async with AsyncExitStack() as stack:
+        # One agent per paper group serves both rounds, instead of one per group and round
+        scorer_llms = {}
+        for has_markdown in (True, False):
+            if any(groups.get((round_num, has_markdown), ((), ()))[1] for round_num in (1, 2)):
+                agent_ctx = await stack.enter_async_context(scorer_agents[has_markdown])
+                scorer_llms[has_markdown] = await agent_ctx.attach_llm(llm_factory)
+
+        logger.info("score_papers.running_rounds", data={"total_rounds": 2})
+
+        decisive_ids = set()
+        if early_exit_low is None and early_exit_high is None:
+            # The rounds are independent (no shared history), so run them concurrently;
+            # the semaphore still bounds how many papers are scored at once across both
+            round1_results, round2_results = await asyncio.gather(
+                run_scoring_round(1, scorer_llms),
+                run_scoring_round(2, scorer_llms),
+            )
+        else:
+            # Round 2 only re-scores papers whose Round 1 score is not decisive
+            round1_results = await run_scoring_round(1, scorer_llms)
+            decisive_ids = {
+                score.paper_id for _, score in round1_results
+                if (early_exit_low is not None and score.overall_score <= early_exit_low)
+                or (early_exit_high is not None and score.overall_score >= early_exit_high)
+            }
+            logger.info("score_papers.early_exit", data={
+                "decisive_papers": len(decisive_ids),
+                "early_exit_low": early_exit_low,
+                "early_exit_high": early_exit_high
+            })
+            for key, (cached_results, pending) in groups.items():
+                if key[0] == 2:
+                    groups[key] = (
+                        [entry for entry in cached_results if entry[0].id not in decisive_ids],
+                        [entry for entry in pending if entry[0].id not in decisive_ids],
+                    )
+            round2_results = await run_scoring_round(2, scorer_llms)
 
     logger.info("score_papers.aggregating", data={
         "round1_count": len(round1_results),
         "round2_count": len(round2_results)
     })
 
-    # Create a mapping of paper_id to scores
-    round1_map = {score.paper_id: (paper, score) for paper, score in round1_results}
-    round2_map = {score.paper_id: (paper, score) for paper, score in round2_results}
-
-    # Find papers that have scores in BOTH rounds
-    common_paper_ids = set(round1_map.keys()) & set(round2_map.keys())
+    # Collect each paper's scores from both rounds, in Round 1 order
+    round_scores: dict[str, list[tuple[Paper, ScoreResult]]] = defaultdict(list)
+    for paper, score in chain(round1_results, round2_results):
+        round_scores[score.paper_id].append((paper, score))
 
     scored_papers = []
 
-    for paper_id in common_paper_ids:
-        paper1, score1 = round1_map[paper_id]
-        paper2, score2 = round2_map[paper_id]
+    for paper_id, entries in round_scores.items():
+        # Only papers that have scores in BOTH rounds are aggregated,
+        # except decisive papers whose Round 2 was skipped
+        if len(entries) != 2 and paper_id not in decisive_ids:
+            continue
+        paper1, score1 = entries[0]
+        scores = [score for _, score in entries]
 
         # Calculate average scores across dimensions
         avg_dimensions = {
-            "relevance": (score1.relevance + score2.relevance) / 2,
-            "novelty": (score1.novelty + score2.novelty) / 2,
-            "soundness": (score1.soundness + score2.soundness) / 2,
-            "clarity": (score1.clarity + score2.clarity) / 2,
-            "significance": (score1.significance + score2.significance) / 2,
+            dimension: sum(getattr(score, dimension) for score in scores) / len(scores)
+            for dimension in SCORE_DIMENSIONS
         }
 
         # Calculate average overall score
-        avg_overall_score = (score1.overall_score + score2.overall_score) / 2
+        avg_overall_score = sum(score.overall_score for score in scores) / len(scores)
 
         # Calculate accept rate from recommendations
         # Parse recommendation strings to check if they start with "Accept"
-        round1_accept = score1.recommendation.strip().lower().startswith("accept")
-        round2_accept = score2.recommendation.strip().lower().startswith("accept")
-        accept_count = sum([round1_accept, round2_accept])
-        accept_rate = accept_count / 2.0
+        accept_count = sum(score.recommendation.strip().lower().startswith("accept") for score in scores)
+        accept_rate = accept_count / len(scores)
 
         # Determine overall recommendation based on accept rate >= 0.5
         overall_recommendation = "Accept" if accept_rate >= 0.5 else "Reject"
@@ -350,7 +581,7 @@ Return ONLY valid JSON. All score fields (relevance, novelty, soundness, clarity
         scored_paper = AggregatedScoreResult(
             paper_id=paper_id,
             paper=paper1,
-            round_scores=[score1, score2],
+            round_scores=scores,
             avg_score=avg_overall_score,
             avg_dimensions=avg_dimensions,
             overall_recommendation=overall_recommendation,
@@ -364,7 +595,7 @@ Return ONLY valid JSON. All score fields (relevance, novelty, soundness, clarity
         logger.debug("score_papers.aggregated", data={
             "paper_id": paper_id,
             "round1_score": score1.overall_score,
-            "round2_score": score2.overall_score,
+            "round2_score": scores[1].overall_score if len(scores) > 1 else None,
             "avg_score": avg_overall_score,
             "accept_rate": accept_rate,
             "overall_recommendation": overall_recommendation
@@ -1,31 +1,35 @@
-from pathlib import Path
 from axpa.outputs.data_models import AggregatedScoreResult, PaperSummary
 from mcp_agent.workflows.llm.augmented_llm import RequestParams
 from axpa.agents.paper_summarizer import create_paper_summarizer_agent
+from axpa.utils import (
+    LLM_RATE_LIMITER,
+    compact_for_llm,
+    llm_cache_key,
+    llm_model_id,
+    load_cached_llm_result,
+    load_markdown_content,
+    save_cached_llm_result,
+)
+from axpa.workflows.stages.retry import LLM_RETRIES, TRANSIENT_LLM_ERRORS, EmptyLLMResponseError, _retry_async
 from typing import List, Optional
 import asyncio
 
 
-def load_markdown_content(markdown_path: str) -> str | None:
-    """Load markdown content from file path."""
-    try:
-        path = Path(markdown_path)
-        if path.exists():
-            return path.read_text(encoding="utf-8")
-        return None
-    except Exception:
-        return None
+# Bump whenever the summary prompts or response handling change, so cached summaries are not reused
+# (the model and summarizer instructions are part of every cache key already)
+SUMMARY_PROMPT_VERSION = 2
 
 
 async def summarize_papers_stage(
     papers: List[AggregatedScoreResult],
     context,
     llm_factory,
+    semaphore: asyncio.Semaphore | None = None,
 ) -> List[PaperSummary]:
     """
     Stage 6: Summarize the papers across 6 key dimensions.
 
-    For each paper, sequentially calls the LLM 6 times to generate:
+    For each paper, calls the LLM 6 times to generate:
     1. Research gap
     2. Related studies
     3. Methodology
@@ -35,10 +39,17 @@ async def summarize_papers_stage(
 
     Implementation pattern:
     - Papers are grouped by whether they have pre-downloaded markdown content
-    - Papers with markdown: content is provided directly, uses arxiv-paper-mcp for related work search
-    - Papers without markdown: agent uses tools to download and read the paper
-    - History is preserved between calls so the LLM has context of previous responses
-    - Papers are processed in parallel, but each paper's 6 summaries are generated sequentially
+    - Papers with markdown: content is provided directly, uses arxiv-paper-mcp for related work search.
+      Every aspect prompt carries the full paper, so the 6 aspects are generated concurrently
+      without conversation history
+    - Papers without markdown: agent uses tools to download and read the paper.
+      History is preserved between calls so the LLM has context of what it has read,
+      so these 6 summaries are generated sequentially
+    - Papers are processed in parallel
+
+    Args:
+        semaphore: Optional semaphore bounding concurrent LLM calls.
+                   If None, every aspect of every paper is requested at once.
 
     Returns:
         List of PaperSummary objects
@@ -46,18 +57,20 @@ async def summarize_papers_stage(
     logger = context.logger
     logger.info("summarize_papers.start", data={"total_papers": len(papers)})
 
-    # Separate papers by markdown availability
+    # Separate papers by markdown availability, reading the files off the event loop
+    contents = await asyncio.gather(
+        *[asyncio.to_thread(load_markdown_content, paper.paper.markdown_path)
+          for paper in papers if paper.paper.markdown_path]
+    )
+    contents = iter(contents)
+
     papers_with_markdown = []
     papers_without_markdown = []
 
     for paper in papers:
-        markdown_path = paper.paper.markdown_path
-        if markdown_path:
-            content = load_markdown_content(markdown_path)
-            if content:
-                papers_with_markdown.append((paper, content))
-            else:
-                papers_without_markdown.append(paper)
+        content = next(contents) if paper.paper.markdown_path else None
+        if content:
+            papers_with_markdown.append((paper, content))
         else:
             papers_without_markdown.append(paper)
 
@@ -71,6 +84,13 @@ async def summarize_papers_stage(
         temperature=0.3
     )
 
+    # Aspects of papers with markdown are independent requests, so they must not share history
+    aspect_request_params = RequestParams(
+        maxTokens=16384,
+        temperature=0.3,
+        use_history=False
+    )
+
     # Define the 6 summary prompts in order
     summary_prompts = [
         ("research_gap", "What problem or gap in existing knowledge is this paper trying to address? Provide a 2-5 sentence explanation."),
@@ -81,24 +101,74 @@ async def summarize_papers_stage(
         ("overall_summary", "Provide a comprehensive summary of the paper covering all key aspects: problem, methods, experiments, results, and contributions. This should be 5-10 sentences.")
     ]
 
-    async def summarize_paper_with_markdown(
+    # Papers with markdown use the simplified agent, the rest the full agent with tools.
+    # Cached summaries are only reused for the same model and agent instruction
+    model_id = llm_model_id(llm_factory, context)
+    summarizer_agents = {
+        has_markdown: create_paper_summarizer_agent(has_markdown=has_markdown) for has_markdown in (True, False)
+    }
+
+    if semaphore is None:
+        # Room for every aspect of every paper
+        semaphore = asyncio.Semaphore(max(len(summary_prompts) * len(papers), 1))
+
+    async def generate_summary(name: str, llm, message: str, params: RequestParams) -> str:
+        """
+        Generate summary text under the semaphore and rate limiter, retrying transient provider
+        errors and empty responses; RuntimeError is raised once retries run out.
+        """
+        async def attempt() -> str:
+            async with semaphore, LLM_RATE_LIMITER:
+                text = await llm.generate_str(message=message, request_params=params)
+            if not text.strip():
+                raise EmptyLLMResponseError(f"empty response from {name}")
+            return text.strip()
+
+        return await _retry_async(attempt, name=name, retries=LLM_RETRIES, retry_on=TRANSIENT_LLM_ERRORS)
+
+    async def summarize_aspect(
         paper: AggregatedScoreResult,
-        markdown_content: str,
+        field_name: str,
+        message: str,
         llm
-    ) -> Optional[PaperSummary]:
-        """Summarize a paper that has pre-downloaded markdown content."""
-        try:
-            # Clear history for clean slate for this paper
-            llm.history.clear()
+    ) -> str:
+        """Generate one self-contained summary aspect, served from the cache when possible."""
+        cache_key = llm_cache_key(
+            "summary", SUMMARY_PROMPT_VERSION, model_id, summarizer_agents[True].instruction, field_name, message
+        )
+        cached = load_cached_llm_result(cache_key)
+        if cached is not None:
+            return cached["text"]
+
+        logger.debug("summarize_papers.generating", data={
+            "paper_id": paper.paper_id,
+            "field": field_name,
+            "has_markdown": True
+        })
 
-            logger.info("summarize_papers.paper_start", data={
-                "paper_id": paper.paper_id,
-                "title": paper.paper.title[:60],
-                "has_markdown": True
-            })
+        summary_text = await generate_summary(
+            f"summarize_aspect({paper.paper_id}, {field_name})", llm, message, aspect_request_params
+        )
 
-            # Initial context message with the paper content
-            initial_message = f"""I need you to summarize this paper in detail.
+        save_cached_llm_result(cache_key, {"text": summary_text})
+
+        logger.debug("summarize_papers.field_complete", data={
+            "paper_id": paper.paper_id,
+            "field": field_name,
+            "length": len(summary_text),
+            "has_markdown": True
+        })
+
+        return summary_text
+
+    async def summarize_aspects_concurrently(
+        paper: AggregatedScoreResult,
+        markdown_content: str,
+        llm
+    ) -> dict[str, str]:
+        """Summarize a paper that has pre-downloaded markdown content, all aspects at once."""
+        # Paper context shared by every aspect prompt
+        paper_context = f"""I need you to summarize one aspect of this paper.
 
 Paper ID: {paper.paper_id}
 Title: {paper.paper.title}
@@ -107,138 +177,109 @@ Published: {paper.paper.published}
 
 ## Paper Content (Markdown)
 
-{markdown_content}
+{compact_for_llm(markdown_content)}
 
 ---
 
-I will ask you to provide summaries for 6 different aspects of this paper. If there are unclear mathematical formulas, you can use the arxiv-latex-mcp tool to get the LaTeX source. For searching related papers, use the arxiv-paper-mcp tools. I'll provide you the prompts for each aspect step by step."""
+If there are unclear mathematical formulas, you can use the arxiv-latex-mcp tool to get the LaTeX source. For searching related papers, use the arxiv-paper-mcp tools."""
 
-            # Send initial context
-            await llm.generate_str(
-                message=initial_message,
-                request_params=request_params
-            )
-
-            # Sequentially generate each summary aspect
-            summaries = {}
-            for field_name, prompt in summary_prompts:
-                logger.debug("summarize_papers.generating", data={
-                    "paper_id": paper.paper_id,
-                    "field": field_name,
-                    "has_markdown": True
-                })
+        # Each aspect prompt is self-contained, so all 6 are generated concurrently
+        texts = await asyncio.gather(*[
+            summarize_aspect(paper, field_name, f"{paper_context}\n\nAspect: {prompt}", llm)
+            for field_name, prompt in summary_prompts
+        ])
+        return dict(zip([field_name for field_name, _ in summary_prompts], texts))
 
-                summary_text = await llm.generate_str(
-                    message=prompt,
-                    request_params=request_params
-                )
+    async def summarize_aspects_sequentially(
+        paper: AggregatedScoreResult,
+        llm
+    ) -> dict[str, str]:
+        """Summarize a paper that needs to be downloaded by the agent, one aspect after another."""
+        # Initial context message about the paper
+        initial_message = f"""I need you to summarize this paper in detail.
 
-                summaries[field_name] = summary_text.strip()
+Paper ID: {paper.paper_id}
+Title: {paper.paper.title}
+Authors: {', '.join(paper.paper.authors[:5])}{'...' if len(paper.paper.authors) > 5 else ''}
+Published: {paper.paper.published}
 
-                logger.debug("summarize_papers.field_complete", data={
-                    "paper_id": paper.paper_id,
-                    "field": field_name,
-                    "length": len(summary_text),
-                    "has_markdown": True
-                })
+I will ask you to provide summaries for 6 different aspects of this paper. You may use `arxiv-latex-mcp` to read the paper at this step. I'll provide you the prompts for each aspect later step by step."""
 
-            # Create PaperSummary object
-            paper_summary = PaperSummary(
-                score=paper,
-                research_gap=summaries["research_gap"],
-                related_studies=summaries["related_studies"],
-                methodology=summaries["methodology"],
-                experiments=summaries["experiments"],
-                further_research=summaries["further_research"],
-                overall_summary=summaries["overall_summary"]
+        # Aspects already summarized from this exact content are served from the cache
+        cache_keys = {
+            field_name: llm_cache_key(
+                "summary", SUMMARY_PROMPT_VERSION, model_id, summarizer_agents[False].instruction,
+                field_name, prompt, initial_message
             )
+            for field_name, prompt in summary_prompts
+        }
+        summaries = {}
+        for field_name, cache_key in cache_keys.items():
+            cached = load_cached_llm_result(cache_key)
+            if cached is not None:
+                summaries[field_name] = cached["text"]
+
+        if len(summaries) < len(summary_prompts):
+            # Send initial context (no response needed, just setting context)
+            async with semaphore, LLM_RATE_LIMITER:
+                await llm.generate_str(
+                    message=initial_message,
+                    request_params=request_params
+                )
 
-            logger.info("summarize_papers.paper_complete", data={
+        # Sequentially generate each remaining summary aspect
+        for field_name, prompt in summary_prompts:
+            if field_name in summaries:
+                continue
+
+            logger.debug("summarize_papers.generating", data={
                 "paper_id": paper.paper_id,
-                "title": paper.paper.title[:60],
-                "has_markdown": True
+                "field": field_name,
+                "has_markdown": False
             })
 
-            return paper_summary
+            summary_text = await generate_summary(
+                f"summarize_aspect({paper.paper_id}, {field_name})", llm, prompt, request_params
+            )
 
-        except Exception as e:
-            logger.error("summarize_papers.paper_error", data={
+            summaries[field_name] = summary_text
+            save_cached_llm_result(cache_keys[field_name], {"text": summaries[field_name]})
+
+            logger.debug("summarize_papers.field_complete", data={
                 "paper_id": paper.paper_id,
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "has_markdown": True
+                "field": field_name,
+                "length": len(summary_text),
+                "has_markdown": False
             })
-            return None
 
-    async def summarize_paper_without_markdown(
+        return summaries
+
+    async def summarize_paper(
         paper: AggregatedScoreResult,
+        markdown_content: str | None,
         llm
     ) -> Optional[PaperSummary]:
-        """Summarize a paper that needs to be downloaded by the agent."""
+        """Summarize a paper, from its markdown content if it has any."""
+        has_markdown = markdown_content is not None
         try:
-            # Clear history for clean slate for this paper
-            llm.history.clear()
-
             logger.info("summarize_papers.paper_start", data={
                 "paper_id": paper.paper_id,
                 "title": paper.paper.title[:60],
-                "has_markdown": False
+                "has_markdown": has_markdown
             })
 
-            # Initial context message about the paper
-            initial_message = f"""I need you to summarize this paper in detail.
-
-Paper ID: {paper.paper_id}
-Title: {paper.paper.title}
-Authors: {', '.join(paper.paper.authors[:5])}{'...' if len(paper.paper.authors) > 5 else ''}
-Published: {paper.paper.published}
-
-I will ask you to provide summaries for 6 different aspects of this paper. You may use `arxiv-latex-mcp` to read the paper at this step. I'll provide you the prompts for each aspect later step by step."""
-
-            # Send initial context (no response needed, just setting context)
-            await llm.generate_str(
-                message=initial_message,
-                request_params=request_params
-            )
-
-            # Sequentially generate each summary aspect
-            summaries = {}
-            for field_name, prompt in summary_prompts:
-                logger.debug("summarize_papers.generating", data={
-                    "paper_id": paper.paper_id,
-                    "field": field_name,
-                    "has_markdown": False
-                })
-
-                summary_text = await llm.generate_str(
-                    message=prompt,
-                    request_params=request_params
-                )
-
-                summaries[field_name] = summary_text.strip()
-
-                logger.debug("summarize_papers.field_complete", data={
-                    "paper_id": paper.paper_id,
-                    "field": field_name,
-                    "length": len(summary_text),
-                    "has_markdown": False
-                })
+            if has_markdown:
+                summaries = await summarize_aspects_concurrently(paper, markdown_content, llm)
+            else:
+                summaries = await summarize_aspects_sequentially(paper, llm)
 
             # Create PaperSummary object
-            paper_summary = PaperSummary(
-                score=paper,
-                research_gap=summaries["research_gap"],
-                related_studies=summaries["related_studies"],
-                methodology=summaries["methodology"],
-                experiments=summaries["experiments"],
-                further_research=summaries["further_research"],
-                overall_summary=summaries["overall_summary"]
-            )
+            paper_summary = PaperSummary(score=paper, **summaries)
 
             logger.info("summarize_papers.paper_complete", data={
                 "paper_id": paper.paper_id,
                 "title": paper.paper.title[:60],
-                "has_markdown": False
+                "has_markdown": has_markdown
             })
 
             return paper_summary
@@ -248,83 +289,70 @@ I will ask you to provide summaries for 6 different aspects of this paper. You m
                 "paper_id": paper.paper_id,
                 "error": str(e),
                 "error_type": type(e).__name__,
-                "has_markdown": False
+                "has_markdown": has_markdown
             })
             return None
 
-    all_summaries = []
-
-    # Process papers with markdown (using simplified agent)
-    if papers_with_markdown:
-        logger.info("summarize_papers.markdown_start", data={
-            "count": len(papers_with_markdown)
+    async def summarize_group(
+        group: List[tuple[AggregatedScoreResult, str | None]],
+        has_markdown: bool
+    ) -> List[PaperSummary]:
+        """Summarize one group of papers (with or without markdown) with its own agent."""
+        label = "markdown" if has_markdown else "download"
+        logger.info(f"summarize_papers.{label}_start", data={
+            "count": len(group)
         })
 
-        summarizer_agent_markdown = create_paper_summarizer_agent(has_markdown=True)
-
-        async with summarizer_agent_markdown as agent_ctx:
-            llm = await agent_ctx.attach_llm(llm_factory)
+        group_summaries = []
 
+        async with summarizer_agents[has_markdown] as agent_ctx:
             try:
+                if has_markdown:
+                    # Aspect calls skip the history, so every paper can share one LLM
+                    llm = await agent_ctx.attach_llm(llm_factory)
+                    llms = [llm] * len(group)
+                else:
+                    # Each paper builds up its own conversation, so each gets its own LLM
+                    llms = [await agent_ctx.attach_llm(llm_factory) for _ in group]
+
                 results = await asyncio.gather(
-                    *[summarize_paper_with_markdown(paper, content, llm)
-                      for paper, content in papers_with_markdown],
+                    *[summarize_paper(paper, content, llm)
+                      for (paper, content), llm in zip(group, llms)],
                     return_exceptions=True
                 )
 
                 for idx, result in enumerate(results):
                     if isinstance(result, Exception):
-                        logger.warning("summarize_papers.markdown_exception", data={
+                        logger.warning(f"summarize_papers.{label}_exception", data={
                             "index": idx,
                             "error": str(result)
                         })
                     elif result is not None:
-                        all_summaries.append(result)
+                        group_summaries.append(result)
 
             except Exception as e:
-                logger.error("summarize_papers.markdown_error", data={
+                logger.error(f"summarize_papers.{label}_error", data={
                     "error": str(e)
                 })
 
-        logger.info("summarize_papers.markdown_complete", data={
-            "successful": len([s for s in all_summaries])
+        logger.info(f"summarize_papers.{label}_complete", data={
+            "successful": len(group_summaries)
         })
 
-    # Process papers without markdown (using full agent with tools)
-    if papers_without_markdown:
-        logger.info("summarize_papers.download_start", data={
-            "count": len(papers_without_markdown)
-        })
+        return group_summaries
 
-        summarizer_agent_download = create_paper_summarizer_agent(has_markdown=False)
-
-        async with summarizer_agent_download as agent_ctx:
-            llm = await agent_ctx.attach_llm(llm_factory)
-
-            try:
-                results = await asyncio.gather(
-                    *[summarize_paper_without_markdown(paper, llm)
-                      for paper in papers_without_markdown],
-                    return_exceptions=True
-                )
-
-                for idx, result in enumerate(results):
-                    if isinstance(result, Exception):
-                        logger.warning("summarize_papers.download_exception", data={
-                            "index": idx,
-                            "error": str(result)
-                        })
-                    elif result is not None:
-                        all_summaries.append(result)
+    all_summaries = []
 
-            except Exception as e:
-                logger.error("summarize_papers.download_error", data={
-                    "error": str(e)
-                })
+    # Process papers with markdown (using simplified agent)
+    if papers_with_markdown:
+        all_summaries.extend(await summarize_group(papers_with_markdown, has_markdown=True))
 
-        logger.info("summarize_papers.download_complete", data={
-            "successful": len(all_summaries) - len(papers_with_markdown)
-        })
+    # Process papers without markdown (using full agent with tools)
+    if papers_without_markdown:
+        all_summaries.extend(await summarize_group(
+            [(paper, None) for paper in papers_without_markdown],
+            has_markdown=False
+        ))
 
     # Log summary
     logger.info("summarize_papers.complete", data={
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import os
+from typing import Any, Callable, Coroutine, Type
+
+import aiohttp
+import openai
+import tenacity
+
+RETRYABLE_HTTP_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRY_WAIT = 30.0
+
+
+class EmptyLLMResponseError(RuntimeError):
+    """An LLM call returned no text (mcp_agent's generate_str logs provider errors and returns what it has)."""
+
+
+# LLM errors worth retrying: timeouts, dropped connections, throttling and provider-side failures.
+# Invalid requests and responses that fail validation are not retried.
+TRANSIENT_LLM_ERRORS = (
+    TimeoutError,
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+    EmptyLLMResponseError,
+)
+
+# Attempts per LLM call before it is given up
+LLM_RETRIES = int(os.getenv("AXPA_LLM_RETRIES", "3"))
+
+
+def _retry_after_seconds(exc: BaseException | None) -> float | None:
+    """Return the Retry-After delay of a 429/503 response, if the server sent one."""
+    if not isinstance(exc, aiohttp.ClientResponseError) or exc.status not in (429, 503):
+        return None
+    value = (exc.headers or {}).get("Retry-After")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+async def _retry_async(
+    fn: Callable[[], Coroutine[Any, Any, Any]],
+    *,
+    name: str,
+    retries: int = 5,
+    delay_time: float = 1.0,
+    retry_on: Type[BaseException] | tuple[Type[BaseException], ...] = Exception,
+) -> Any:
+
+    def _should_retry(exc: BaseException) -> bool:
+        # HTTP errors are only worth retrying when the server is throttling or flaky
+        if isinstance(exc, aiohttp.ClientResponseError):
+            return exc.status in RETRYABLE_HTTP_STATUSES
+        return isinstance(exc, retry_on)
+
+    backoff = tenacity.wait_exponential_jitter(initial=delay_time, max=MAX_RETRY_WAIT)
+
+    def _wait(retry_state: tenacity.RetryCallState) -> float:
+        retry_after = _retry_after_seconds(retry_state.outcome.exception())
+        if retry_after is not None:
+            return min(retry_after, MAX_RETRY_WAIT)
+        return backoff(retry_state)
+
+    @tenacity.retry(
+        retry=tenacity.retry_if_exception(_should_retry),
+        wait=_wait,
+        stop=tenacity.stop_after_attempt(retries),
+        reraise=True,
+    )
+    async def _wrapped() -> Any:
+        return await fn()
+
+    try:
+        return await _wrapped()
+    except Exception as e:
+        raise RuntimeError(f"{name} failed after {retries} attempts") from e
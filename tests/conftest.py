@@ -1,12 +1,47 @@
 """Shared fixtures for tests."""
 
-import pytest
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import aiohttp
+import pytest
+import pytest_asyncio
 
 
-@pytest.fixture
+def _to_markdown(pdf_data: bytes, pages: list[int] | None) -> str:
+    """Extract markdown from PDF bytes; runs in a worker process of pdf_executor."""
+    import pymupdf
+    import pymupdf4llm
+
+    doc = pymupdf.Document(stream=pdf_data)
+    try:
+        return pymupdf4llm.to_markdown(doc, pages=pages, show_progress=False)
+    finally:
+        doc.close()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def aiohttp_session():
-    """Create an aiohttp session for tests."""
-    session = aiohttp.ClientSession()
-    yield session
-    await session.close()
+    """Create an aiohttp session shared by the tests of a module, so they reuse its kept-alive connections."""
+    connector = aiohttp.TCPConnector(limit=64, limit_per_host=8, keepalive_timeout=60, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def pdf_executor():
+    """Worker processes for CPU-bound PDF extraction, spawned so they do not fork a threaded test process."""
+    executor = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn"))
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture
+def extract_markdown(pdf_executor):
+    """Extract markdown from PDF bytes in pdf_executor, keeping the event loop free."""
+    async def extract(pdf_data: bytes, pages: list[int] | None) -> str:
+        return await asyncio.get_running_loop().run_in_executor(pdf_executor, _to_markdown, pdf_data, pages)
+
+    return extract
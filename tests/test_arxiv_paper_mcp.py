@@ -1,13 +1,21 @@
 """Tests for the arXiv Paper MCP server."""
 
+import asyncio
+import gzip
 import json
 import os
 from pathlib import Path
+import orjson
 import pytest
+import pytest_asyncio
 from axpa.servers.arxiv_paper_mcp.main import (
+    PDF_DOWNLOAD_TIMEOUT,
     fetch_arxiv_papers,
     _get_cache_path,
+    _get_page_file,
     _load_from_cache,
+    _load_page_count,
+    _save_page_count,
     _save_to_cache,
     _extract_pages_content,
 )
@@ -16,23 +24,103 @@ from axpa.servers.arxiv_paper_mcp.main import (
 # Test paper ID provided by user
 TEST_PAPER_ID = "2503.09573"
 
-# Test cache directory
-TEST_CACHE_DIR = "./outputs/papers/test_json_cache"
+# Chunk size for streaming the test paper's PDF
+PDF_CHUNK_SIZE = 64 * 1024
 
+# Search queries (and their limits) the fetch tests assert against, fetched together up front
+TEST_QUERIES = {
+    "machine learning": 2,
+    "neural network": 1,
+    "MCP-Zero": 5,
+    "xyzabc123nonsensequery456": 1,
+    "transformer attention": 3,
+    "deep learning": 3,
+    "large language model": 1,
+    "reinforcement learning": 1,
+    "computer vision": 1,
+}
 
+# Queries in flight at once against the arXiv API
+MAX_CONCURRENT_QUERIES = 4
+
+# Async tests run on the module-wide event loop of the shared aiohttp_session fixture
+module_loop = pytest.mark.asyncio(loop_scope="module")
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def test_pdf_bytes(aiohttp_session):
+    """Download the test paper's PDF once for all tests of the module."""
+    pdf_url = f"https://arxiv.org/pdf/{TEST_PAPER_ID}"
+
+    async with aiohttp_session.get(pdf_url, timeout=PDF_DOWNLOAD_TIMEOUT) as response:
+        assert response.status == 200, f"Failed to fetch PDF: HTTP {response.status}"
+
+        # Stream the body into a single buffer instead of read(), which holds every chunk
+        # and their joined copy at once; pymupdf opens the bytearray without another copy
+        pdf_data = bytearray()
+        async for chunk in response.content.iter_chunked(PDF_CHUNK_SIZE):
+            pdf_data.extend(chunk)
+        return pdf_data
+
+
+@pytest.fixture(scope="module")
+def test_pdf_document(test_pdf_bytes):
+    """Open the test paper's PDF once for all tests of the module."""
+    import pymupdf
+
+    doc = pymupdf.Document(stream=test_pdf_bytes)
+    yield doc
+    doc.close()
+
+
+@pytest.fixture(scope="module")
+def test_page_chunks(test_pdf_document):
+    """Extract the test paper's page chunks once for all tests of the module."""
+    import pymupdf4llm
+
+    return pymupdf4llm.to_markdown(test_pdf_document, page_chunks=True, show_progress=False)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def fetched_papers(aiohttp_session):
+    """Run all TEST_QUERIES concurrently once, keyed by query, for the fetch tests of the module."""
+    # Bound the burst so the arXiv API does not throttle it
+    semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENT_QUERIES)
+
+    async def fetch(query: str, limit: int):
+        async with semaphore:
+            return await fetch_arxiv_papers(aiohttp_session, query, limit=limit)
+
+    results = await asyncio.gather(*[fetch(query, limit) for query, limit in TEST_QUERIES.items()])
+    return dict(zip(TEST_QUERIES, results))
+
+
+@pytest.fixture(scope="module")
+def test_cache_dir(tmp_path_factory):
+    """Temporary JSON cache directory shared by the tests of the module."""
+    return str(tmp_path_factory.mktemp("json_cache"))
+
+
+@pytest.fixture(scope="module")
+def test_cache_path(test_cache_dir):
+    """Resolve (and create) the test paper's cache directory once for all tests of the module."""
+    return _get_cache_path(TEST_PAPER_ID, test_cache_dir)
+
+
+@module_loop
 class TestFetchArxivPapers:
     """Tests for the fetch_arxiv_papers function."""
 
-    async def test_fetch_papers_returns_list(self, aiohttp_session):
+    async def test_fetch_papers_returns_list(self, fetched_papers):
         """Test that fetch_arxiv_papers returns a list of papers."""
-        papers = await fetch_arxiv_papers(aiohttp_session, "machine learning", limit=2)
+        papers = fetched_papers["machine learning"]
 
         assert isinstance(papers, list)
         assert len(papers) <= 2
 
-    async def test_fetch_papers_has_required_fields(self, aiohttp_session):
+    async def test_fetch_papers_has_required_fields(self, fetched_papers):
         """Test that each paper has all required fields."""
-        papers = await fetch_arxiv_papers(aiohttp_session, "neural network", limit=1)
+        papers = fetched_papers["neural network"]
 
         assert len(papers) > 0
         paper = papers[0]
@@ -41,132 +129,82 @@ class TestFetchArxivPapers:
         for field in required_fields:
             assert field in paper, f"Missing field: {field}"
 
-    async def test_fetch_specific_paper_by_title(self, aiohttp_session):
+    async def test_fetch_specific_paper_by_title(self, fetched_papers):
         """Test fetching a specific paper by title keywords."""
         # Use a unique title keyword from the test paper instead of ID search
-        papers = await fetch_arxiv_papers(aiohttp_session, "MCP-Zero", limit=5)
+        papers = fetched_papers["MCP-Zero"]
 
         assert len(papers) > 0
         # Check that we got some results with reasonable structure
         assert "id" in papers[0]
 
-    async def test_fetch_papers_empty_query(self, aiohttp_session):
+    async def test_fetch_papers_empty_query(self, fetched_papers):
         """Test that an empty or very specific query might return no results."""
         # Using a very specific nonsense query that should return no results
-        papers = await fetch_arxiv_papers(aiohttp_session, "xyzabc123nonsensequery456", limit=1)
+        papers = fetched_papers["xyzabc123nonsensequery456"]
 
         assert isinstance(papers, list)
 
 
+@module_loop
 class TestGetPaperContentDirect:
     """Tests for getting paper content directly (without MCP context)."""
 
-    async def test_download_and_extract_paper(self, aiohttp_session):
+    async def test_download_and_extract_paper(self, test_pdf_bytes, extract_markdown):
         """Test downloading and extracting a paper's content."""
-        import pymupdf
-        import pymupdf4llm
-        import aiohttp
-
-        pdf_url = f"http://arxiv.org/pdf/{TEST_PAPER_ID}"
-
-        async with aiohttp_session.get(pdf_url, timeout=aiohttp.ClientTimeout(total=120)) as response:
-            assert response.status == 200, f"Failed to fetch PDF: HTTP {response.status}"
-            pdf_data = await response.read()
-
-        # Open PDF from memory stream
-        doc = pymupdf.Document(stream=pdf_data)
-
         # Extract markdown
-        markdown_content = pymupdf4llm.to_markdown(
-            doc,
-            pages=[0],  # Just first page for speed
-            show_progress=False,
-        )
-
-        doc.close()
+        markdown_content = await extract_markdown(test_pdf_bytes, [0])  # Just first page for speed
 
         assert isinstance(markdown_content, str)
         assert len(markdown_content) > 0
 
-    async def test_extract_specific_pages(self, aiohttp_session):
+    async def test_extract_specific_pages(self, test_pdf_bytes, extract_markdown):
         """Test extracting specific pages from a paper."""
-        import pymupdf
-        import pymupdf4llm
-        import aiohttp
-
-        pdf_url = f"http://arxiv.org/pdf/{TEST_PAPER_ID}"
-
-        async with aiohttp_session.get(pdf_url, timeout=aiohttp.ClientTimeout(total=120)) as response:
-            pdf_data = await response.read()
-
-        doc = pymupdf.Document(stream=pdf_data)
-
         # Extract first two pages
-        markdown_content = pymupdf4llm.to_markdown(
-            doc,
-            pages=[0, 1],
-            show_progress=False,
-        )
-
-        doc.close()
+        markdown_content = await extract_markdown(test_pdf_bytes, [0, 1])
 
         assert isinstance(markdown_content, str)
         assert len(markdown_content) > 0
 
-    async def test_extract_all_pages(self, aiohttp_session):
+    async def test_extract_all_pages(self, test_pdf_bytes, extract_markdown):
         """Test extracting all pages from a paper."""
-        import pymupdf
-        import pymupdf4llm
-        import aiohttp
-
-        pdf_url = f"http://arxiv.org/pdf/{TEST_PAPER_ID}"
-
-        async with aiohttp_session.get(pdf_url, timeout=aiohttp.ClientTimeout(total=120)) as response:
-            pdf_data = await response.read()
-
-        doc = pymupdf.Document(stream=pdf_data)
-
         # Extract all pages (pages=None)
-        markdown_content = pymupdf4llm.to_markdown(
-            doc,
-            pages=None,
-            show_progress=False,
-        )
-
-        doc.close()
+        markdown_content = await extract_markdown(test_pdf_bytes, None)
 
         assert isinstance(markdown_content, str)
         assert len(markdown_content) > 100  # Should have substantial content
 
 
+@module_loop
 class TestSearchArxivIntegration:
     """Integration tests for search functionality."""
 
-    async def test_search_returns_valid_json(self, aiohttp_session):
+    async def test_search_returns_valid_json(self, fetched_papers):
         """Test that search returns valid JSON."""
-        papers = await fetch_arxiv_papers(aiohttp_session, "transformer attention", limit=3)
+        papers = fetched_papers["transformer attention"]
 
         # Simulate what search_arxiv does
-        result = json.dumps(papers, indent=2)
+        result = orjson.dumps(papers).decode()
 
         # Should be valid JSON
-        parsed = json.loads(result)
+        parsed = orjson.loads(result)
         assert isinstance(parsed, list)
 
-    async def test_search_respects_limit(self, aiohttp_session):
+    async def test_search_respects_limit(self, fetched_papers):
         """Test that search respects the limit parameter."""
-        limit = 3
-        papers = await fetch_arxiv_papers(aiohttp_session, "deep learning", limit=limit)
+        limit = TEST_QUERIES["deep learning"]
+        papers = fetched_papers["deep learning"]
 
         assert len(papers) <= limit
 
 
+@module_loop
 class TestPaperMetadata:
     """Tests for paper metadata structure."""
 
-    async def test_paper_id_format(self, aiohttp_session):
+    async def test_paper_id_format(self, fetched_papers):
         """Test that paper IDs are in expected format."""
-        papers = await fetch_arxiv_papers(aiohttp_session, "large language model", limit=1)
+        papers = fetched_papers["large language model"]
 
         assert len(papers) > 0
         paper_id = papers[0]["id"]
@@ -175,25 +213,25 @@ class TestPaperMetadata:
         # Should contain digits
         assert any(c.isdigit() for c in paper_id)
 
-    async def test_pdf_link_format(self, aiohttp_session):
+    async def test_pdf_link_format(self, fetched_papers):
         """Test that PDF links are properly formatted."""
-        papers = await fetch_arxiv_papers(aiohttp_session, "neural network", limit=1)
+        papers = fetched_papers["neural network"]
 
         assert len(papers) > 0
         pdf_link = papers[0]["pdf_link"]
-        assert pdf_link.startswith("http://arxiv.org/pdf/")
+        assert pdf_link.startswith("https://arxiv.org/pdf/")
 
-    async def test_authors_is_list(self, aiohttp_session):
+    async def test_authors_is_list(self, fetched_papers):
         """Test that authors field is a list."""
-        papers = await fetch_arxiv_papers(aiohttp_session, "reinforcement learning", limit=1)
+        papers = fetched_papers["reinforcement learning"]
 
         if papers:
             authors = papers[0]["authors"]
             assert isinstance(authors, list)
 
-    async def test_categories_is_list(self, aiohttp_session):
+    async def test_categories_is_list(self, fetched_papers):
         """Test that categories field is a list."""
-        papers = await fetch_arxiv_papers(aiohttp_session, "computer vision", limit=1)
+        papers = fetched_papers["computer vision"]
 
         if papers:
             categories = papers[0]["categories"]
@@ -203,23 +241,23 @@ class TestPaperMetadata:
 class TestCacheHelperFunctions:
     """Tests for caching helper functions."""
 
-    def test_get_cache_path_creates_directory(self):
+    def test_get_cache_path_creates_directory(self, test_cache_dir):
         """Test that _get_cache_path creates the cache directory."""
-        cache_path = _get_cache_path(TEST_PAPER_ID, TEST_CACHE_DIR)
+        cache_path = _get_cache_path(TEST_PAPER_ID, test_cache_dir)
 
         assert cache_path.parent.exists()
-        assert cache_path.name == f"{TEST_PAPER_ID}.json"
+        assert cache_path.name == TEST_PAPER_ID
 
-    def test_get_cache_path_handles_slash_in_id(self):
+    def test_get_cache_path_handles_slash_in_id(self, test_cache_dir):
         """Test that _get_cache_path handles paper IDs with slashes."""
         paper_id_with_slash = "cs.AI/0001001"
-        cache_path = _get_cache_path(paper_id_with_slash, TEST_CACHE_DIR)
+        cache_path = _get_cache_path(paper_id_with_slash, test_cache_dir)
 
         # Slash should be replaced with underscore
         assert "/" not in cache_path.name
-        assert cache_path.name == "cs.AI_0001001.json"
+        assert cache_path.name == "cs.AI_0001001"
 
-    def test_save_and_load_cache(self):
+    def test_save_and_load_cache(self, test_cache_dir):
         """Test saving and loading page chunks from cache."""
         # Create test page chunks
         test_chunks = [
@@ -228,27 +266,71 @@ class TestCacheHelperFunctions:
             {"text": "Page 3 content", "metadata": {"page_number": 3}},
         ]
 
-        cache_file = _get_cache_path("test_paper_cache", TEST_CACHE_DIR)
+        cache_path = _get_cache_path("test_paper_cache", test_cache_dir)
 
         # Save to cache
-        _save_to_cache(cache_file, test_chunks)
+        _save_to_cache(cache_path, test_chunks)
 
-        # Verify file exists
-        assert cache_file.exists()
+        # Verify one file per page plus the metadata file exist
+        assert (cache_path / "meta.json").exists()
+        assert len(list(cache_path.glob("page_*.json.gz"))) == 3
 
         # Load from cache
-        loaded_chunks = _load_from_cache(cache_file)
+        loaded_chunks = _load_from_cache(cache_path)
 
         assert loaded_chunks is not None
         assert len(loaded_chunks) == 3
         assert loaded_chunks[0]["text"] == "Page 1 content"
         assert loaded_chunks[2]["text"] == "Page 3 content"
 
-    def test_load_from_cache_returns_none_for_missing_file(self):
+    def test_load_from_cache_specific_pages(self, test_cache_dir):
+        """Test that _load_from_cache only returns the requested pages."""
+        test_chunks = [
+            {"text": "Page 1 content"},
+            {"text": "Page 2 content"},
+            {"text": "Page 3 content"},
+        ]
+
+        cache_path = _get_cache_path("test_paper_pages_cache", test_cache_dir)
+        _save_to_cache(cache_path, test_chunks)
+
+        # Page 10 doesn't exist and should be skipped
+        loaded_chunks = _load_from_cache(cache_path, [2, 10])
+
+        assert loaded_chunks == [{"text": "Page 3 content"}]
+        assert _load_page_count(cache_path) == 3
+
+    def test_page_count_only_cache(self, test_cache_dir):
+        """Test that a cached page count alone does not count as cached content."""
+        cache_path = _get_cache_path("test_paper_page_count_cache", test_cache_dir)
+        _save_page_count(cache_path, 12)
+
+        assert _load_page_count(cache_path) == 12
+        assert _load_from_cache(cache_path) is None
+        assert _load_from_cache(cache_path, [0]) is None
+
+    def test_load_from_cache_uses_memory_cache(self, test_cache_dir):
+        """Test that pages already parsed are served without re-reading disk."""
+        cache_path = _get_cache_path("test_paper_mem_cache", test_cache_dir)
+        _save_to_cache(cache_path, [{"text": "Page 1 content"}, {"text": "Page 2 content"}])
+
+        (cache_path / "page_0001.json.gz").unlink()
+
+        assert _load_from_cache(cache_path, [1]) == [{"text": "Page 2 content"}]
+
+    def test_load_from_cache_reads_uncompressed_pages(self, test_cache_dir):
+        """Test that page files written before compression are still readable."""
+        cache_path = _get_cache_path("test_paper_plain_cache", test_cache_dir)
+        _save_page_count(cache_path, 1)
+        (cache_path / "page_0000.json").write_text(json.dumps({"text": "Page 1 content"}))
+
+        assert _load_from_cache(cache_path) == [{"text": "Page 1 content"}]
+
+    def test_load_from_cache_returns_none_for_missing_file(self, test_cache_dir):
         """Test that _load_from_cache returns None for non-existent file."""
-        cache_file = Path(TEST_CACHE_DIR) / "nonexistent_paper.json"
+        cache_path = Path(test_cache_dir) / "nonexistent_paper"
 
-        result = _load_from_cache(cache_file)
+        result = _load_from_cache(cache_path)
 
         assert result is None
 
@@ -294,33 +376,26 @@ class TestCacheHelperFunctions:
         assert "Page 1 content" in result
         # Should not crash, just skip the invalid page
 
+    def test_extract_pages_content_duplicate_unsorted_pages(self):
+        """Test that duplicate pages are emitted once, in page order."""
+        test_chunks = [
+            {"text": "Page 1 content"},
+            {"text": "Page 2 content"},
+            {"text": "Page 3 content"},
+        ]
 
-class TestCachingIntegration:
-    """Integration tests for caching with real paper downloads."""
-
-    async def test_download_and_cache_paper(self, aiohttp_session):
-        """Test downloading a paper and caching it as JSON page chunks."""
-        import pymupdf
-        import pymupdf4llm
-        import aiohttp
-
-        pdf_url = f"http://arxiv.org/pdf/{TEST_PAPER_ID}"
+        result = _extract_pages_content(test_chunks, [2, 0, 2])
 
-        async with aiohttp_session.get(pdf_url, timeout=aiohttp.ClientTimeout(total=120)) as response:
-            assert response.status == 200
-            pdf_data = await response.read()
+        assert result == "Page 1 content\n\nPage 3 content"
 
-        # Open PDF from memory stream
-        doc = pymupdf.Document(stream=pdf_data)
 
-        # Extract with page_chunks=True
-        page_chunks = pymupdf4llm.to_markdown(
-            doc,
-            page_chunks=True,
-            show_progress=False,
-        )
+@module_loop
+class TestCachingIntegration:
+    """Integration tests for caching with real paper downloads."""
 
-        doc.close()
+    async def test_download_and_cache_paper(self, test_page_chunks, test_cache_path):
+        """Test downloading a paper and caching it as JSON page chunks."""
+        page_chunks = test_page_chunks
 
         # Verify page_chunks structure
         assert isinstance(page_chunks, list)
@@ -332,45 +407,34 @@ class TestCachingIntegration:
             assert isinstance(chunk["text"], str)
 
         # Save to cache
-        cache_file = _get_cache_path(TEST_PAPER_ID, TEST_CACHE_DIR)
-        _save_to_cache(cache_file, page_chunks)
-
-        # Verify cache file exists and is valid JSON
-        assert cache_file.exists()
+        cache_path = test_cache_path
+        _save_to_cache(cache_path, page_chunks)
 
-        with open(cache_file, "r", encoding="utf-8") as f:
-            cached_data = json.load(f)
+        # Verify the metadata, and that every page file holds exactly its chunk's JSON
+        # (comparing bytes, so the cached pages need not be parsed back)
+        assert _load_page_count(cache_path) == len(page_chunks)
 
-        assert isinstance(cached_data, list)
-        assert len(cached_data) == len(page_chunks)
+        for page_num, chunk in enumerate(page_chunks):
+            page_file = _get_page_file(cache_path, page_num)
+            assert page_file.stat().st_size > 0
+            assert gzip.decompress(page_file.read_bytes()) == orjson.dumps(chunk)
 
-        print(f"\nCache file created at: {cache_file}")
+        cache_size = sum(f.stat().st_size for f in cache_path.iterdir())
+        print(f"\nCache directory created at: {cache_path}")
         print(f"Total pages cached: {len(page_chunks)}")
-        print(f"Cache file size: {cache_file.stat().st_size} bytes")
+        print(f"Cache directory size: {cache_size} bytes")
 
-    async def test_load_cached_paper_and_extract_pages(self, aiohttp_session):
+    async def test_load_cached_paper_and_extract_pages(self, test_page_chunks, test_cache_path):
         """Test loading a cached paper and extracting specific pages."""
-        cache_file = _get_cache_path(TEST_PAPER_ID, TEST_CACHE_DIR)
+        cache_path = test_cache_path
 
         # This test depends on test_download_and_cache_paper running first
         # If cache doesn't exist, download it first
-        if not cache_file.exists():
-            import pymupdf
-            import pymupdf4llm
-            import aiohttp
-
-            pdf_url = f"http://arxiv.org/pdf/{TEST_PAPER_ID}"
-
-            async with aiohttp_session.get(pdf_url, timeout=aiohttp.ClientTimeout(total=120)) as response:
-                pdf_data = await response.read()
-
-            doc = pymupdf.Document(stream=pdf_data)
-            page_chunks = pymupdf4llm.to_markdown(doc, page_chunks=True, show_progress=False)
-            doc.close()
-            _save_to_cache(cache_file, page_chunks)
+        if _load_page_count(cache_path) is None:
+            _save_to_cache(cache_path, test_page_chunks)
 
         # Load from cache
-        page_chunks = _load_from_cache(cache_file)
+        page_chunks = _load_from_cache(cache_path)
         assert page_chunks is not None
 
         # Extract first page only
@@ -389,28 +453,16 @@ class TestCachingIntegration:
         print(f"First 3 pages content length: {len(first_three_pages)}")
         print(f"All pages content length: {len(all_pages)}")
 
-    async def test_page_chunks_metadata_structure(self, aiohttp_session):
+    async def test_page_chunks_metadata_structure(self, test_page_chunks, test_cache_path):
         """Test that page chunks have the expected metadata structure."""
-        cache_file = _get_cache_path(TEST_PAPER_ID, TEST_CACHE_DIR)
+        cache_path = test_cache_path
 
         # Ensure cache exists
-        if not cache_file.exists():
-            import pymupdf
-            import pymupdf4llm
-            import aiohttp
-
-            pdf_url = f"http://arxiv.org/pdf/{TEST_PAPER_ID}"
-
-            async with aiohttp_session.get(pdf_url, timeout=aiohttp.ClientTimeout(total=120)) as response:
-                pdf_data = await response.read()
-
-            doc = pymupdf.Document(stream=pdf_data)
-            page_chunks = pymupdf4llm.to_markdown(doc, page_chunks=True, show_progress=False)
-            doc.close()
-            _save_to_cache(cache_file, page_chunks)
+        if _load_page_count(cache_path) is None:
+            _save_to_cache(cache_path, test_page_chunks)
 
         # Load and inspect structure
-        page_chunks = _load_from_cache(cache_file)
+        page_chunks = _load_from_cache(cache_path)
         assert page_chunks is not None
 
         # Check first page chunk structure
@@ -0,0 +1,156 @@
+"""Tests for the shared helpers in axpa.utils."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from axpa.utils import (
+    AsyncLimiter,
+    compact_for_llm,
+    llm_cache_key,
+    llm_model_id,
+    load_cached_llm_result,
+    save_cached_llm_result,
+)
+
+# Filler long enough to push a section over the compaction budgets below
+FILLER = "lorem ipsum dolor sit amet " * 20
+
+
+@pytest.fixture
+def llm_cache_dir(tmp_path, monkeypatch):
+    """Point the LLM result cache at a temporary directory."""
+    monkeypatch.setenv("AXPA_LLM_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+class TestCompactForLlm:
+    """Tests for compact_for_llm."""
+
+    def test_short_markdown_is_unchanged(self):
+        """Test that markdown within the budget is returned as is."""
+        md = "# Title\n\n## Related Work\n\nShort text."
+
+        assert compact_for_llm(md, max_chars=1000) == md
+
+    def test_keeps_key_sections_and_omits_others(self):
+        """Test that key sections and their subsections are kept and other sections reduced to headings."""
+        md = (
+            "Paper Title\nAlice, Bob\n\n"
+            f"## 1 Introduction\n\nintro {FILLER}\n\n"
+            f"## 2 Related Work\n\nrelated {FILLER}\n\n"
+            f"## 3 Method\n\nmethod {FILLER}\n\n"
+            f"### 3.1 Architecture\n\narchitecture {FILLER}\n\n"
+            f"## 4 Appendix\n\nappendix {FILLER}\n"
+        )
+
+        compacted = compact_for_llm(md, max_chars=len(md) - 1)
+
+        assert compacted.startswith("Paper Title\nAlice, Bob")
+        assert "intro lorem" in compacted
+        assert "method lorem" in compacted
+        assert "architecture lorem" in compacted
+        assert "## 2 Related Work\n\n[Section omitted]" in compacted
+        assert "## 4 Appendix\n\n[Section omitted]" in compacted
+        assert "related lorem" not in compacted
+        assert "appendix lorem" not in compacted
+
+    def test_numbered_section_ends_kept_section(self):
+        """Test that a numbered heading at a deeper level is not treated as a subsection of a kept one."""
+        md = f"# Introduction\n\nintro {FILLER}\n\n## 2 Background\n\nbackground {FILLER}\n"
+
+        compacted = compact_for_llm(md, max_chars=len(md) - 1)
+
+        assert "intro lorem" in compacted
+        assert "background lorem" not in compacted
+
+    def test_truncates_when_still_too_long(self):
+        """Test that the result is cut at max_chars if the kept sections alone are too long."""
+        md = f"## Introduction\n\n{FILLER * 10}"
+
+        compacted = compact_for_llm(md, max_chars=200)
+
+        assert compacted == md[:200] + "\n\n[Truncated]\n"
+
+
+class TestAsyncLimiter:
+    """Tests for the AsyncLimiter token bucket."""
+
+    async def test_bursts_then_paces_in_arrival_order(self):
+        """Test that max_rate acquisitions pass at once and later ones are spaced by the refill rate."""
+        limiter = AsyncLimiter(2, 0.2)
+        start = time.monotonic()
+        order = []
+
+        async def acquire(idx: int):
+            async with limiter:
+                order.append((idx, time.monotonic() - start))
+
+        await asyncio.gather(*[acquire(idx) for idx in range(4)])
+
+        assert [idx for idx, _ in order] == [0, 1, 2, 3]
+        delays = [delay for _, delay in order]
+        assert delays[1] < 0.05
+        # One token per 0.1s once the burst is used up
+        assert 0.08 <= delays[2] < 0.18
+        assert 0.18 <= delays[3] < 0.28
+
+    def test_can_be_shared_across_event_loops(self):
+        """Test that one limiter keeps working across successive asyncio.run calls."""
+        limiter = AsyncLimiter(1, 0.05)
+
+        async def acquire_several():
+            await asyncio.gather(*[limiter.acquire() for _ in range(3)])
+
+        asyncio.run(acquire_several())
+        asyncio.run(acquire_several())
+
+
+class TestLlmCache:
+    """Tests for the LLM result cache helpers."""
+
+    def test_cache_key_depends_on_every_part(self):
+        """Test that keys are stable and change with any part, including how parts are split."""
+        key = llm_cache_key("score", 1, "model", "prompt")
+
+        assert key == llm_cache_key("score", 1, "model", "prompt")
+        assert key != llm_cache_key("score", 2, "model", "prompt")
+        assert key != llm_cache_key("score", 1, "other-model", "prompt")
+        assert llm_cache_key("ab", "c") != llm_cache_key("a", "bc")
+
+    def test_model_id_includes_provider_config(self):
+        """Test that the model id names the factory, endpoint and default model."""
+        class FakeLLM:
+            @staticmethod
+            def get_provider_config(context):
+                return SimpleNamespace(base_url="http://llm.local/v1", default_model="test-model")
+
+        model_id = llm_model_id(FakeLLM, context=None)
+
+        assert "FakeLLM" in model_id
+        assert "http://llm.local/v1" in model_id
+        assert "test-model" in model_id
+
+    def test_save_and_load(self, llm_cache_dir):
+        """Test that a saved result is loaded back unchanged."""
+        key = llm_cache_key("summary", "prompt")
+        save_cached_llm_result(key, {"text": "A summary."})
+
+        assert load_cached_llm_result(key) == {"text": "A summary."}
+        assert list(llm_cache_dir.glob("*.tmp")) == []
+
+    def test_load_miss_returns_none(self, llm_cache_dir):
+        """Test that a key that was never saved is a miss."""
+        assert load_cached_llm_result(llm_cache_key("missing")) is None
+
+    def test_load_unreadable_entry_returns_none(self, llm_cache_dir):
+        """Test that corrupt or unreadable cache entries are treated as misses."""
+        corrupt_key = llm_cache_key("corrupt")
+        (llm_cache_dir / f"{corrupt_key}.json").write_text("{not json")
+        unreadable_key = llm_cache_key("unreadable")
+        (llm_cache_dir / f"{unreadable_key}.json").mkdir()
+
+        assert load_cached_llm_result(corrupt_key) is None
+        assert load_cached_llm_result(unreadable_key) is None
@@ -0,0 +1,312 @@
+"""Offline tests for the workflow stage helpers (feed parsing, retries, batched LLM fallbacks)."""
+
+import re
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import aiohttp
+import pytest
+
+from axpa.outputs.data_models import BatchFilterResult, BatchScoreResult, FilterResult, Paper, ScoreResult
+from axpa.workflows.stages import paper_filtering, paper_scoring, retry
+from axpa.workflows.stages.html_formatting import _split_field_sections
+from axpa.workflows.stages.paper_fetching import _collect_papers_in_range, _iter_feed_entries
+
+
+def make_feed(entries: list[tuple[str, str]]) -> bytes:
+    """Build an arXiv Atom feed with one entry per (paper ID, published timestamp) pair."""
+    entry_xml = "".join(
+        f"""
+  <entry>
+    <id>http://arxiv.org/abs/{paper_id}</id>
+    <published>{published}</published>
+    <title>Title of
+      {paper_id}</title>
+    <summary>  Abstract of {paper_id}.
+    </summary>
+    <author><name>Alice A</name></author>
+    <author><name> Bob B </name></author>
+    <arxiv:primary_category term="cs.SE"/>
+    <category term="cs.SE"/>
+    <category term="cs.LG"/>
+  </entry>"""
+        for paper_id, published in entries
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">'
+        f"<title>ArXiv Query</title>{entry_xml}\n</feed>\n"
+    ).encode()
+
+
+def http_error(status: int, retry_after: str | None = None) -> aiohttp.ClientResponseError:
+    """Build the error aiohttp raises for a response with the given status."""
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    return aiohttp.ClientResponseError(None, (), status=status, headers=headers)
+
+
+def make_paper(paper_id: str) -> Paper:
+    return Paper(
+        id=paper_id,
+        title=f"Title {paper_id}",
+        authors=["Alice A"],
+        abstract=f"Abstract of {paper_id}.",
+        categories=["cs.SE"],
+        published="2025-01-02T00:00:00Z",
+        pdf_link=f"https://arxiv.org/pdf/{paper_id}",
+    )
+
+
+def make_score(paper_id: str | None, overall_score: float = 6.0) -> ScoreResult:
+    return ScoreResult(
+        paper_id=paper_id,
+        relevance=overall_score,
+        novelty=overall_score,
+        soundness=overall_score,
+        clarity=overall_score,
+        significance=overall_score,
+        overall_score=overall_score,
+        summary="A summary.",
+        strengths="Strengths.",
+        weaknesses="Weaknesses.",
+        recommendation="Accept",
+    )
+
+
+class NullLogger:
+    """Logger that accepts and drops every event."""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class FakeAgent:
+    """Agent stand-in whose attached LLM is the given fake."""
+
+    def __init__(self, llm):
+        self.llm = llm
+        self.instruction = "Fake agent instruction."
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def attach_llm(self, llm_factory):
+        return self.llm
+
+
+@pytest.fixture
+def context():
+    return SimpleNamespace(logger=NullLogger())
+
+
+class TestSplitFieldSections:
+    """Tests for splitting batched HTML responses on their field markers."""
+
+    def test_splits_on_marker_lines(self):
+        """Test that each section runs up to the next marker and is stripped."""
+        response = (
+            "Here is the HTML:\n"
+            "### FIELD: research_gap\n<div>gap</div>\n\n"
+            "###FIELD:methodology  \n<div>method</div>\n"
+        )
+
+        assert _split_field_sections(response) == {
+            "research_gap": "<div>gap</div>",
+            "methodology": "<div>method</div>",
+        }
+
+    def test_ignores_markers_inside_lines(self):
+        """Test that only whole marker lines start a section."""
+        response = "### FIELD: experiments\n<p>see ### FIELD: other</p>\n"
+
+        assert _split_field_sections(response) == {"experiments": "<p>see ### FIELD: other</p>"}
+
+    def test_response_without_markers(self):
+        """Test that a response without markers yields no sections."""
+        assert _split_field_sections("<div>no markers</div>") == {}
+
+
+class TestFeedParsing:
+    """Tests for parsing arXiv API feeds into papers."""
+
+    def test_iter_feed_entries(self):
+        """Test that entries are read as plain dicts with whitespace stripped."""
+        feed = make_feed([("2501.00001v1", "2025-01-02T10:00:00Z")])
+
+        entries = list(_iter_feed_entries(feed))
+
+        assert entries == [{
+            "id": "http://arxiv.org/abs/2501.00001v1",
+            "title": "Title of\n      2501.00001v1",
+            "summary": "Abstract of 2501.00001v1.",
+            "published": "2025-01-02T10:00:00Z",
+            "authors": ["Alice A", "Bob B"],
+            "categories": ["cs.SE", "cs.LG"],
+        }]
+
+    def test_collect_papers_in_range(self):
+        """Test that only papers within the (inclusive) range are kept, in feed order."""
+        feed = make_feed([
+            ("2501.00004v1", "2025-01-04T00:00:01Z"),
+            ("2501.00003v1", "2025-01-04T00:00:00Z"),
+            ("2501.00002v1", "2025-01-02T12:00:00Z"),
+            ("2501.00001v1", "2025-01-01T23:59:59Z"),
+            ("2501.00000v1", "not a date"),
+        ])
+        start = datetime(2025, 1, 2, tzinfo=timezone.utc)
+        end = datetime(2025, 1, 4, tzinfo=timezone.utc)
+
+        dated_papers = _collect_papers_in_range(feed, start, end)
+
+        assert [paper.id for _, paper in dated_papers] == ["2501.00003v1", "2501.00002v1"]
+        published_dt, paper = dated_papers[0]
+        assert published_dt == end
+        assert paper.pdf_link == "https://arxiv.org/pdf/2501.00003v1"
+        assert paper.abstract == "Abstract of 2501.00003v1."
+        assert paper.categories == ["cs.SE", "cs.LG"]
+
+    def test_collect_papers_with_offset_timestamps(self):
+        """Test that non-UTC timestamps skip the string pre-check and are compared as datetimes."""
+        feed = make_feed([("2501.00001v1", "2025-01-02T01:00:00+02:00")])
+        start = datetime(2025, 1, 1, 22, tzinfo=timezone.utc)
+        end = datetime(2025, 1, 1, 23, 30, tzinfo=timezone.utc)
+
+        dated_papers = _collect_papers_in_range(feed, start, end)
+
+        assert [paper.id for _, paper in dated_papers] == ["2501.00001v1"]
+
+
+class TestRetryAsync:
+    """Tests for _retry_async and its Retry-After handling."""
+
+    def test_retry_after_seconds(self):
+        """Test that Retry-After is only honored on 429/503 responses with a numeric value."""
+        assert retry._retry_after_seconds(http_error(429, "7")) == 7.0
+        assert retry._retry_after_seconds(http_error(503, "0")) == 0.0
+        assert retry._retry_after_seconds(http_error(503, "Wed, 21 Oct 2015 07:28:00 GMT")) is None
+        assert retry._retry_after_seconds(http_error(500, "7")) is None
+        assert retry._retry_after_seconds(http_error(429)) is None
+        assert retry._retry_after_seconds(TimeoutError()) is None
+
+    async def test_retries_throttled_requests(self):
+        """Test that 429/503 responses are retried until the call succeeds."""
+        errors = [http_error(503, "0"), http_error(429, "0")]
+        attempts = []
+
+        async def fn():
+            attempts.append(1)
+            if errors:
+                raise errors.pop(0)
+            return "ok"
+
+        assert await retry._retry_async(fn, name="fn", retries=3) == "ok"
+        assert len(attempts) == 3
+
+    async def test_retry_after_is_capped(self, monkeypatch):
+        """Test that a long Retry-After is capped at MAX_RETRY_WAIT."""
+        monkeypatch.setattr(retry, "MAX_RETRY_WAIT", 0.01)
+        errors = [http_error(429, "3600")]
+
+        async def fn():
+            if errors:
+                raise errors.pop(0)
+            return "ok"
+
+        assert await retry._retry_async(fn, name="fn", retries=2) == "ok"
+
+    async def test_client_errors_are_not_retried(self):
+        """Test that HTTP errors other than throttling and 5xx fail on the first attempt."""
+        attempts = []
+
+        async def fn():
+            attempts.append(1)
+            raise http_error(404)
+
+        with pytest.raises(RuntimeError, match="fn failed after 3 attempts") as exc_info:
+            await retry._retry_async(fn, name="fn", retries=3)
+        assert len(attempts) == 1
+        assert exc_info.value.__cause__.status == 404
+
+    async def test_gives_up_after_retries(self):
+        """Test that RuntimeError (chained to the last error) is raised once retries run out."""
+        attempts = []
+
+        async def fn():
+            attempts.append(1)
+            raise http_error(503, "0")
+
+        with pytest.raises(RuntimeError) as exc_info:
+            await retry._retry_async(fn, name="fn", retries=2)
+        assert len(attempts) == 2
+        assert exc_info.value.__cause__.status == 503
+
+
+class FakeFilterLLM:
+    """Filter LLM whose batch responses leave out the last paper of each batch."""
+
+    def __init__(self):
+        self.single_ids = []
+
+    async def generate_structured(self, message, response_model, request_params=None):
+        paper_ids = re.findall(r'"id":"([^"]+)"', message)
+        if response_model is BatchFilterResult:
+            return BatchFilterResult(results=[
+                FilterResult(paper_id=paper_id, accept=paper_id != "p1", reasoning="r", relevance_score=5)
+                for paper_id in paper_ids[:-1]
+            ])
+        self.single_ids.extend(paper_ids)
+        return FilterResult(accept=True, reasoning="r", relevance_score=5)
+
+
+class TestFilterBatchFallback:
+    """Tests for the batched paper filter."""
+
+    async def test_papers_left_out_of_a_batch_are_filtered_singly(self, context, monkeypatch):
+        """Test that papers missing from a batch response are filtered one by one."""
+        llm = FakeFilterLLM()
+        monkeypatch.setattr(paper_filtering, "create_paper_filter_agent", lambda: FakeAgent(llm))
+        papers = [make_paper(f"p{idx}") for idx in range(3)]
+
+        accepted = await paper_filtering.filter_papers_stage(papers, "query", context, llm_factory=None)
+
+        assert llm.single_ids == ["p2"]
+        assert [paper.id for paper in accepted] == ["p0", "p2"]
+
+
+class FakeScoringLLM:
+    """Scoring LLM whose batch formatting responses leave out the first paper of each batch."""
+
+    def __init__(self):
+        self.single_format_ids = []
+
+    async def generate_str(self, message, request_params=None):
+        paper_id = re.search(r"Review paper ID: (\S+)", message).group(1)
+        return f"Evaluation of {paper_id}"
+
+    async def generate_structured(self, message, response_model, request_params=None):
+        if response_model is BatchScoreResult:
+            paper_ids = re.findall(r"### Paper ID: (\S+)", message)
+            return BatchScoreResult(results=[make_score(paper_id) for paper_id in paper_ids[1:]])
+        paper_id = re.search(r"Evaluation of (\S+)", message).group(1)
+        self.single_format_ids.append(paper_id)
+        return make_score(None)
+
+
+class TestScoreFormatBatchFallback:
+    """Tests for the batched formatting of paper evaluations."""
+
+    async def test_evaluations_left_out_of_a_batch_are_formatted_singly(self, context, tmp_path, monkeypatch):
+        """Test that evaluations missing from a batch response are formatted one by one, in both rounds."""
+        monkeypatch.setenv("AXPA_LLM_CACHE_DIR", str(tmp_path))
+        llm = FakeScoringLLM()
+        monkeypatch.setattr(paper_scoring, "create_paper_scorer_agent", lambda has_markdown: FakeAgent(llm))
+        papers = [make_paper(f"p{idx}") for idx in range(3)]
+
+        scored = await paper_scoring.score_papers_stage(papers, "query", context, llm_factory=None)
+
+        assert sorted(llm.single_format_ids) == ["p0", "p0"]
+        assert sorted(result.paper_id for result in scored) == ["p0", "p1", "p2"]
+        assert all(len(result.round_scores) == 2 for result in scored)